@@ -12,16 +12,22 @@ Features:
 - Comprehensive error handling
 """
 
+import errno
+import io
 import os
-import shutil
-import tempfile
+import stat
+import mmap
+import fnmatch
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable, TypeVar
-from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Union, Callable, TypeVar
 import time
 import threading
 import hashlib
+import itertools
+from collections import OrderedDict
+from functools import lru_cache
+from weakref import WeakValueDictionary
 
 # Import custom exceptions
 from core.exceptions import (
@@ -35,6 +41,192 @@ logger = logging.getLogger(__name__)
 # Type variable for generic functions
 T = TypeVar("T")
 
+# Files at or above this size are hashed/read through a memory map
+MMAP_THRESHOLD = 1 << 20
+
+# get_file_info never hashes files larger than this by default
+HASH_SIZE_LIMIT = 100 * 1024 * 1024
+
+# Durability tiers accepted by write_text/write_binary:
+#   "none"   - write the file in place, no temp file and no sync
+#   "atomic" - temp file + os.replace; atomic, but may be lost on power loss
+#   "fsync"  - as "atomic", plus fdatasync of the data before the replace
+#   "full"   - as "fsync", plus a full fsync and an fsync of the parent dir
+DURABILITY_LEVELS = ("none", "atomic", "fsync", "full")
+
+# Write buffer for streamed content (callables and file objects)
+STREAM_BUFFER_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=None)
+def _process_umask() -> int:
+    """
+    Read the process umask once, without changing it.
+
+    os.umask can only be read by setting it, which would briefly give files
+    created by other threads the wrong mode. Linux reports the umask in
+    /proc/self/status; elsewhere it is taken from the mode of a probe file
+    created with 0o666.
+
+    Returns:
+        int: The umask bits.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    import tempfile
+
+    probe = os.path.join(tempfile.gettempdir(),
+                         f".umask-probe-{os.getpid()}-{threading.get_ident()}")
+    fd = os.open(probe, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        return 0o666 & ~stat.S_IMODE(os.fstat(fd).st_mode)
+    finally:
+        os.close(fd)
+        os.unlink(probe)
+
+
+# Concrete Path class for this platform (PosixPath or WindowsPath)
+_PATH_TYPE = type(Path())
+
+
+@lru_cache(maxsize=1024)
+def _resolve_cached(base_dir: str, path: Union[str, Path]) -> Path:
+    """Join a relative path onto base_dir, memoized for hot call sites."""
+    path_obj = Path(path)
+    if path_obj.is_absolute():
+        return path_obj
+    return Path(base_dir) / path_obj
+
+
+# errno values meaning "this kernel copy primitive can't handle these fds"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name) for name in
+    ("ENOSYS", "EXDEV", "EINVAL", "EOPNOTSUPP", "ENOTSUP", "EBADF", "EPERM")
+    if hasattr(errno, name)
+)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """
+    Copy file contents inside the kernel.
+
+    Tries os.copy_file_range (which reflinks on copy-on-write filesystems)
+    and then os.sendfile. Both advance the file offsets themselves.
+
+    Args:
+        src_fd (int): Source file descriptor, positioned at 0.
+        dst_fd (int): Destination file descriptor, positioned at 0.
+        size (int): Number of bytes to copy.
+
+    Returns:
+        bool: True if the contents were copied, False if neither primitive
+            is usable and the caller should copy in userspace.
+    """
+    copiers = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(lambda n: os.copy_file_range(src_fd, dst_fd, n))
+    if hasattr(os, "sendfile"):
+        copiers.append(lambda n: os.sendfile(dst_fd, src_fd, None, n))
+
+    for copier in copiers:
+        copied = 0
+        try:
+            while copied < size:
+                sent = copier(size - copied)
+                if sent == 0:
+                    break
+                copied += sent
+            return True
+        except OSError as e:
+            # Only fall back if nothing was written yet
+            if copied or e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    return False
+
+
+def _copy_stream(src: Any, dst: Any) -> None:
+    """
+    Copy the rest of a readable file object into an open file.
+
+    Regular files with real descriptors are copied in the kernel via
+    _kernel_copy; anything else goes through shutil.copyfileobj.
+
+    Args:
+        src: Readable file object, copied from its current position.
+        dst: Writable file object.
+    """
+    import shutil
+
+    try:
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+        kernel_ok = (not isinstance(src, io.TextIOBase)
+                     and not isinstance(dst, io.TextIOBase))
+    except (AttributeError, OSError, ValueError):
+        # No usable descriptor (e.g. BytesIO)
+        kernel_ok = False
+
+    if kernel_ok:
+        src_st = os.fstat(src_fd)
+        pos = src.tell()
+        size = src_st.st_size - pos
+        if stat.S_ISREG(src_st.st_mode) and size > 0:
+            # Sync the OS offsets with the buffered objects' positions
+            dst.flush()
+            os.lseek(src_fd, pos, os.SEEK_SET)
+            if _kernel_copy(src_fd, dst_fd, size):
+                src.seek(pos + size)
+                dst.seek(0, os.SEEK_END)
+                return
+            src.seek(pos)
+
+    shutil.copyfileobj(src, dst, STREAM_BUFFER_SIZE)
+
+
+# (epoch second, formatted '%Y%m%d_%H%M%S') of the last backup stamp
+_stamp_cache = (-1, "")
+
+
+def _backup_stamp() -> str:
+    """
+    Format the current local time for backup names, once per second.
+
+    Returns:
+        str: The time formatted as '%Y%m%d_%H%M%S'.
+    """
+    global _stamp_cache  # pylint: disable=global-statement
+    now = int(time.time())
+    second, stamp = _stamp_cache
+    if second != now:
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        _stamp_cache = (now, stamp)
+    return stamp
+
+
+def _fadvise(fd: int, *advice: int) -> None:
+    """
+    Give the kernel access-pattern hints for a whole file.
+
+    No-op where posix_fadvise is unavailable; hint failures are ignored.
+
+    Args:
+        fd (int): Open file descriptor.
+        *advice (int): os.POSIX_FADV_* constants to apply in order.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for adv in advice:
+        try:
+            os.posix_fadvise(fd, 0, 0, adv)
+        except OSError:
+            return
+
 
 class FileManager:
     """
@@ -44,6 +236,11 @@ class FileManager:
     and deleting files with proper error handling and logging.
     """
 
+    # Seconds a failed existence probe is remembered by exists()/is_file()
+    NEGATIVE_CACHE_TTL = 0.5
+    # Most missing paths remembered at once; the least recently probed go first
+    NEGATIVE_CACHE_SIZE = 1024
+
     def __init__(self, base_dir: Optional[str] = None):
         """
         Initialize the FileManager.
@@ -53,9 +250,26 @@ class FileManager:
                 If None, uses the current working directory.
         """
         self.base_dir = base_dir or os.getcwd()
+        # Makes backup names unique within a second
+        self._backup_counter = itertools.count()
+        # Resolved path -> monotonic time it was last found missing
+        self._negative_cache: "OrderedDict[str, float]" = OrderedDict()
+        # Guards updates of _negative_cache; lookups do not take it
+        self._negative_lock = threading.Lock()
         logger.debug(
             "FileManager initialized with base directory: %s", self.base_dir)
 
+    @property
+    def base_dir(self) -> Union[str, Path]:
+        """Base directory for relative paths."""
+        return self._base_dir
+
+    @base_dir.setter
+    def base_dir(self, value: Union[str, Path]) -> None:
+        self._base_dir = value
+        # String form used as the path-resolution cache key
+        self._base_str = str(value)
+
     def _resolve_path(self, path: Union[str, Path]) -> Path:
         """
         Resolve a path to an absolute path.
@@ -66,10 +280,70 @@ class FileManager:
         Returns:
             Path: The resolved absolute path.
         """
-        path_obj = Path(path)
-        if path_obj.is_absolute():
-            return path_obj
-        return Path(self.base_dir) / path_obj
+        # Exact type check: internal callers mostly pass resolved Paths back in
+        if type(path) is _PATH_TYPE:  # pylint: disable=unidiomatic-typecheck
+            if path.is_absolute():
+                return path
+        elif isinstance(path, Path) and path.is_absolute():
+            return path
+        return _resolve_cached(self._base_str, path)
+
+    def _probe(self, path: Path) -> Optional[os.stat_result]:
+        """
+        Stat a path, answering repeated probes of a missing path from cache.
+
+        A path found missing is remembered for NEGATIVE_CACHE_TTL seconds,
+        or until this manager writes, copies, moves or creates anything.
+        At most NEGATIVE_CACHE_SIZE paths are kept.
+
+        Args:
+            path (Path): Resolved path to probe.
+
+        Returns:
+            Optional[os.stat_result]: The stat result, or None if missing.
+        """
+        key = str(path)
+        now = time.monotonic()
+        missing_since = self._negative_cache.get(key)
+        if missing_since is not None and now - missing_since < self.NEGATIVE_CACHE_TTL:
+            return None
+
+        st = self._stat_once(path)
+        if st is None:
+            cache = self._negative_cache
+            with self._negative_lock:
+                # Re-inserted so a refreshed entry moves to the end
+                cache.pop(key, None)
+                cache[key] = now
+                if len(cache) > self.NEGATIVE_CACHE_SIZE:
+                    cache.popitem(last=False)
+        elif missing_since is not None:
+            with self._negative_lock:
+                self._negative_cache.pop(key, None)
+        return st
+
+    def _paths_changed(self) -> None:
+        """Forget cached missing paths after this manager creates files."""
+        if self._negative_cache:
+            with self._negative_lock:
+                self._negative_cache.clear()
+
+    @staticmethod
+    def _stat_once(path: Path) -> Optional[os.stat_result]:
+        """
+        Stat a path once so existence and type checks share one syscall.
+
+        Args:
+            path (Path): Path to stat.
+
+        Returns:
+            Optional[os.stat_result]: The stat result, or None if the path
+                does not exist.
+        """
+        try:
+            return path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
     def exists(self, path: Union[str, Path]) -> bool:
         """
@@ -81,8 +355,7 @@ class FileManager:
         Returns:
             bool: True if the file exists, False otherwise.
         """
-        file_path = self._resolve_path(path)
-        return file_path.exists()
+        return self._probe(self._resolve_path(path)) is not None
 
     def is_file(self, path: Union[str, Path]) -> bool:
         """
@@ -94,8 +367,8 @@ class FileManager:
         Returns:
             bool: True if the path is a file, False otherwise.
         """
-        file_path = self._resolve_path(path)
-        return file_path.is_file()
+        st = self._probe(self._resolve_path(path))
+        return st is not None and stat.S_ISREG(st.st_mode)
 
     def is_dir(self, path: Union[str, Path]) -> bool:
         """
@@ -107,8 +380,8 @@ class FileManager:
         Returns:
             bool: True if the path is a directory, False otherwise.
         """
-        file_path = self._resolve_path(path)
-        return file_path.is_dir()
+        st = self._probe(self._resolve_path(path))
+        return st is not None and stat.S_ISDIR(st.st_mode)
 
     def ensure_dir(self, path: Union[str, Path]) -> Path:
         """
@@ -126,6 +399,7 @@ class FileManager:
         dir_path = self._resolve_path(path)
         try:
             dir_path.mkdir(parents=True, exist_ok=True)
+            self._paths_changed()
             return dir_path
         except Exception as e:
             logger.error("Failed to create directory %s: %s", dir_path, e)
@@ -175,15 +449,26 @@ class FileManager:
             logger.error("Error reading file %s: %s", file_path, e)
             raise FileReadError(str(file_path), str(e)) from e
 
-    def read_binary(self, path: Union[str, Path]) -> bytes:
+    def read_binary(
+        self,
+        path: Union[str, Path],
+        mmap_threshold: Optional[int] = MMAP_THRESHOLD,
+    ) -> Union[bytes, memoryview]:
         """
         Read binary data from a file.
 
+        Files of at least ``mmap_threshold`` bytes are memory-mapped and
+        returned as a read-only memoryview instead of being copied into a
+        new bytes object. The mapping is released once the view is
+        garbage collected. Use read_binary_copy when real bytes are needed.
+
         Args:
             path (Union[str, Path]): Path to the file.
+            mmap_threshold (int, optional): Minimum size for mapping the file.
+                If None, the file is always read into bytes.
 
         Returns:
-            bytes: The file content as binary data.
+            Union[bytes, memoryview]: The file content as binary data.
 
         Raises:
             FileReadError: If the file cannot be read.
@@ -191,6 +476,13 @@ class FileManager:
         file_path = self._resolve_path(path)
         try:
             with open(file_path, "rb") as file:
+                if (mmap_threshold is not None
+                        and os.fstat(file.fileno()).st_size >= mmap_threshold):
+                    if hasattr(os, "posix_fadvise"):
+                        _fadvise(file.fileno(), os.POSIX_FADV_SEQUENTIAL,
+                                 os.POSIX_FADV_WILLNEED)
+                    return memoryview(
+                        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
                 return file.read()
         except FileNotFoundError:
             logger.error("File not found: %s", file_path)
@@ -199,12 +491,28 @@ class FileManager:
             logger.error("Error reading binary file %s: %s", file_path, str(e))
             raise FileReadError(str(file_path), str(e)) from None
 
+    def read_binary_copy(self, path: Union[str, Path]) -> bytes:
+        """
+        Read binary data from a file into a bytes object.
+
+        Args:
+            path (Union[str, Path]): Path to the file.
+
+        Returns:
+            bytes: The file content as binary data.
+
+        Raises:
+            FileReadError: If the file cannot be read.
+        """
+        return self.read_binary(path, mmap_threshold=None)
+
     def write_text(
         self,
         path: Union[str, Path],
         content: str,
         encoding: str = "utf-8",
         make_backup: bool = False,
+        durability: str = "atomic",
     ) -> None:
         """
         Write text to a file.
@@ -214,6 +522,7 @@ class FileManager:
             content (str): Text content to write.
             encoding (str): Character encoding to use.
             make_backup (bool): Whether to make a backup of the existing file.
+            durability (str): One of DURABILITY_LEVELS.
 
         Raises:
             FileWriteError: If the file cannot be written.
@@ -224,27 +533,35 @@ class FileManager:
         self.ensure_parent_dir(file_path)
 
         # Make backup if requested
-        if make_backup and file_path.exists():
-            self.make_backup(file_path)
+        if make_backup:
+            self._backup_existing(file_path)
 
         try:
             # Use atomic write for safety
-            self._atomic_write(file_path, content, mode="w", encoding=encoding)
+            self._atomic_write(file_path, content, mode="w", encoding=encoding,
+                               durability=durability)
             logger.debug("Text file written: %s", file_path)
         except Exception as e:
             logger.error("Error writing text file %s: %s", file_path, str(e))
             raise FileWriteError(str(file_path), str(e)) from e
 
     def write_binary(
-        self, path: Union[str, Path], content: bytes, make_backup: bool = False
+        self,
+        path: Union[str, Path],
+        content: Union[bytes, memoryview, BinaryIO],
+        make_backup: bool = False,
+        durability: str = "atomic",
     ) -> None:
         """
         Write binary data to a file.
 
         Args:
             path (Union[str, Path]): Path to the file.
-            content (bytes): Binary content to write.
+            content (Union[bytes, memoryview, BinaryIO]): Binary content to
+                write, or a readable binary file object whose remaining
+                content is copied (in the kernel when possible).
             make_backup (bool): Whether to make a backup of the existing file.
+            durability (str): One of DURABILITY_LEVELS.
 
         Raises:
             FileWriteError: If the file cannot be written.
@@ -255,52 +572,144 @@ class FileManager:
         self.ensure_parent_dir(file_path)
 
         # Make backup if requested
-        if make_backup and file_path.exists():
-            self.make_backup(file_path)
+        if make_backup:
+            self._backup_existing(file_path)
 
         try:
             # Use atomic write for safety
-            self._atomic_write(file_path, content, mode="wb")
+            self._atomic_write(file_path, content, mode="wb",
+                               durability=durability)
             logger.debug("Text file written: %s", file_path)
         except Exception as e:
             logger.error("Error writing text file %s: %s", file_path, str(e))
             raise FileWriteError(str(file_path), str(e)) from e
 
+    def write_stream(
+        self,
+        path: Union[str, Path],
+        writer: Callable[[Any], None],
+        binary: bool = False,
+        encoding: str = "utf-8",
+        make_backup: bool = False,
+        durability: str = "atomic",
+    ) -> None:
+        """
+        Write a file incrementally through a callback.
+
+        The callback receives the open (temporary) file object, so large
+        content can be produced chunk by chunk instead of being built in
+        memory first. The file is still replaced atomically.
+
+        Args:
+            path (Union[str, Path]): Path to the file.
+            writer (Callable[[Any], None]): Callback that writes the content.
+            binary (bool): Open the file in binary instead of text mode.
+            encoding (str): Character encoding to use in text mode.
+            make_backup (bool): Whether to make a backup of the existing file.
+            durability (str): One of DURABILITY_LEVELS.
+
+        Raises:
+            FileWriteError: If the file cannot be written. Exceptions raised
+                by the writer itself propagate unchanged.
+        """
+        file_path = self._resolve_path(path)
+
+        # Create parent directory if it doesn't exist
+        self.ensure_parent_dir(file_path)
+
+        # Make backup if requested
+        if make_backup:
+            self._backup_existing(file_path)
+
+        try:
+            self._atomic_write(file_path, writer, mode="wb" if binary else "w",
+                               encoding=encoding, durability=durability)
+            logger.debug("File streamed: %s", file_path)
+        except (FileWriteError, ValueError) as e:
+            logger.error("Error streaming file %s: %s", file_path, str(e))
+            raise
+
     def _atomic_write(
         self,
         path: Path,
-        content: Union[str, bytes],
+        content: Union[str, bytes, memoryview, BinaryIO, Callable[[Any], None]],
         mode: str,
         encoding: Optional[str] = None,
+        durability: str = "atomic",
     ) -> None:
         """
         Write to a file atomically using a temporary file.
 
         Args:
             path (Path): Path to the file.
-            content (Union[str, bytes]): Content to write.
+            content: Content to write, a readable file object to copy from,
+                or a callable that receives the open file object and writes
+                to it.
             mode (str): File mode ('w' or 'wb').
             encoding (str, optional): Character encoding to use.
+            durability (str): One of DURABILITY_LEVELS.
+
+        Raises:
+            ValueError: If the durability level is unknown.
+            FileWriteError: If the file cannot be written. Any other
+                exception raised by a content callable propagates unchanged.
         """
-        # Create a temporary file in the same directory
-        temp_file = Path(f"{path}.temp.{int(time.time())}")
+        import tempfile
+
+        if durability not in DURABILITY_LEVELS:
+            raise ValueError(f"Unsupported durability level: {durability}")
+
+        kwargs = {}
+        if "b" not in mode:  # Text mode
+            # Use utf-8 as default if encoding is None
+            kwargs["encoding"] = encoding or "utf-8"
+        if callable(content) or hasattr(content, "read"):
+            # Streamed content arrives in small pieces; batch them up
+            kwargs["buffering"] = STREAM_BUFFER_SIZE
+
+        if durability == "none":
+            try:
+                with open(path, mode, **kwargs) as f:
+                    self._write_content(f, content)
+                self._paths_changed()
+                return
+            except (IOError, OSError) as e:
+                raise FileWriteError(str(path), str(e)) from e
+
+        # Create a uniquely named temporary file in the same directory
+        fd, temp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        temp_file = Path(temp_name)
 
         try:
+            # mkstemp creates 0600; keep the target's mode or the umask default
+            if hasattr(os, "fchmod"):
+                target_st = self._stat_once(path)
+                os.fchmod(fd, stat.S_IMODE(target_st.st_mode) if target_st
+                          else 0o666 & ~_process_umask())
+
             # Write content to the temporary file
-            kwargs = {}
-            if "b" not in mode:  # Text mode
-                # Use utf-8 as default if encoding is None
-                kwargs["encoding"] = encoding or "utf-8"
-            with open(
-                    temp_file, mode, encoding="utf-8" if "b" not in mode else None, **kwargs) as f:
-                f.write(content)
-                f.flush()
-                os.fsync(f.fileno())  # Ensure data is written to disk
+            with os.fdopen(fd, mode, **kwargs) as f:
+                fd = -1
+                self._write_content(f, content)
+                if durability != "atomic":
+                    f.flush()
+                    if durability == "full" or not hasattr(os, "fdatasync"):
+                        os.fsync(f.fileno())
+                    else:
+                        # Data only; skips flushing unrelated inode metadata
+                        os.fdatasync(f.fileno())
 
             # Replace the original file with the temporary file
             # This is atomic on POSIX systems
             os.replace(temp_file, path)
-        except (IOError, OSError) as e:
+            self._paths_changed()
+
+            if durability == "full":
+                self._fsync_dir(path.parent)
+        except Exception as e:
+            if fd != -1:
+                os.close(fd)
             # Clean up the temporary file if an error occurred
             if temp_file.exists():
                 try:
@@ -311,7 +720,42 @@ class FileManager:
                         temp_file,
                         str(cleanup_error),
                     )
-            raise FileWriteError(str(path), str(e)) from e
+            if isinstance(e, (IOError, OSError)):
+                raise FileWriteError(str(path), str(e)) from e
+            raise
+
+    @staticmethod
+    def _write_content(f: Any, content: Any) -> None:
+        """
+        Write content of any form accepted by _atomic_write to a file.
+
+        Args:
+            f: Open file object.
+            content: String/bytes, readable file object, or writer callable.
+        """
+        if callable(content):
+            content(f)
+        elif hasattr(content, "read"):
+            _copy_stream(content, f)
+        else:
+            f.write(content)
+
+    @staticmethod
+    def _fsync_dir(dir_path: Path) -> None:
+        """
+        Flush a directory entry to disk so a rename inside it is durable.
+
+        Args:
+            dir_path (Path): Directory to sync.
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            # Directories cannot be opened for fsync on this platform
+            return
+        fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
     def make_backup(
         self, path: Union[str, Path], backup_suffix: Optional[str] = None
@@ -322,7 +766,7 @@ class FileManager:
         Args:
             path (Union[str, Path]): Path to the file to backup.
             backup_suffix (str, optional): Suffix to append to the backup file name.
-                If None, uses timestamp.
+                If None, uses a timestamp plus process id and counter.
 
         Returns:
             Path: Path to the backup file.
@@ -333,16 +777,61 @@ class FileManager:
         """
         file_path = self._resolve_path(path)
 
-        if not file_path.exists():
+        st = self._stat_once(file_path)
+        if st is None:
             logger.error("Cannot backup non-existent file: %s", file_path)
             raise FileReadError(str(file_path), "File not found")
 
-        # Default suffix is a timestamp
-        suffix = backup_suffix or f".bak.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        return self._backup_known(file_path, st, backup_suffix)
+
+    def _backup_existing(self, file_path: Path) -> Optional[Path]:
+        """
+        Back up a file before it is overwritten, if it exists.
+
+        Args:
+            file_path (Path): Resolved path to the file.
+
+        Returns:
+            Optional[Path]: Path to the backup, or None if there was no file.
+        """
+        st = self._stat_once(file_path)
+        if st is None:
+            return None
+        return self._backup_known(file_path, st)
+
+    def _backup_known(
+        self,
+        file_path: Path,
+        st: os.stat_result,
+        backup_suffix: Optional[str] = None,
+    ) -> Path:
+        """
+        Back up a file whose stat result has already been taken.
+
+        Args:
+            file_path (Path): Resolved path to the file.
+            st (os.stat_result): Stat result for file_path.
+            backup_suffix (str, optional): Suffix to append to the backup file name.
+
+        Returns:
+            Path: Path to the backup file.
+
+        Raises:
+            FileWriteError: If the backup cannot be created.
+        """
+        import shutil
+
+        # Default suffix is a timestamp; pid and counter keep it unique
+        suffix = backup_suffix or (
+            f".bak.{_backup_stamp()}.{os.getpid()}.{next(self._backup_counter):06d}")
         backup_path = Path(f"{file_path}{suffix}")
 
         try:
-            shutil.copy2(file_path, backup_path)
+            if stat.S_ISREG(st.st_mode):
+                self._copy_file(file_path, backup_path, st.st_size)
+            else:
+                shutil.copy2(file_path, backup_path)
+            self._paths_changed()
             logger.debug("Backup created: %s", backup_path)
             return backup_path
         except Exception as e:
@@ -364,21 +853,31 @@ class FileManager:
             FileWriteError: If the file cannot be deleted.
             FileReadError: If the file doesn't exist and missing_ok is False.
         """
-        file_path = self._resolve_path(path)
+        import shutil
 
-        if not file_path.exists():
-            if missing_ok:
-                return False
-            logger.error("Cannot delete non-existent file: %s", file_path)
-            raise FileReadError(str(file_path), "File not found")
+        file_path = self._resolve_path(path)
 
         try:
-            if file_path.is_dir():
-                shutil.rmtree(file_path)
-            else:
+            try:
+                # Files are the common case: unlink straight away, no stat
                 os.unlink(file_path)
+            except (IsADirectoryError, PermissionError):
+                # Directories fail with EISDIR (Linux) or EPERM (macOS)
+                if not os.path.isdir(file_path):
+                    raise
+                try:
+                    os.rmdir(file_path)
+                except OSError as e:
+                    if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                        raise
+                    shutil.rmtree(file_path)
             logger.debug("Deleted: %s", file_path)
             return True
+        except FileNotFoundError:
+            if missing_ok:
+                return False
+            logger.error("Cannot delete non-existent file: %s", file_path)
+            raise FileReadError(str(file_path), "File not found") from None
         except Exception as e:
             logger.error("Error deleting %s: %s", file_path, e)
             raise FileWriteError(f"Error deleting file: {e}") from e
@@ -401,38 +900,65 @@ class FileManager:
             FileReadError: If the source cannot be read.
             FileWriteError: If the destination cannot be written.
         """
+        import shutil
+
         src_path = self._resolve_path(src)
         dst_path = self._resolve_path(dst)
 
-        if not src_path.exists():
+        src_st = self._stat_once(src_path)
+        if src_st is None:
             logger.error("Source does not exist: %s", str(src_path))
             raise FileReadError(str(src_path), "Source not found")
 
-        if dst_path.exists() and not overwrite:
+        dst_st = self._stat_once(dst_path)
+        if dst_st is not None and not overwrite:
             logger.error("Destination already exists: %s", str(dst_path))
             raise FileWriteError(str(dst_path), "Destination already exists")
 
         try:
-            if src_path.is_dir():
-                # If destination exists and is a file, remove it
-                if dst_path.exists() and dst_path.is_file():
-                    os.unlink(dst_path)
-                # Copy directory and its contents
-                if overwrite and dst_path.exists():
-                    shutil.rmtree(dst_path)
+            if stat.S_ISDIR(src_st.st_mode):
+                if dst_st is not None:
+                    # If destination exists and is a file, remove it
+                    if stat.S_ISREG(dst_st.st_mode):
+                        os.unlink(dst_path)
+                    # Copy directory and its contents
+                    elif overwrite:
+                        shutil.rmtree(dst_path)
                 shutil.copytree(src_path, dst_path)
             else:
                 # Create parent directory if it doesn't exist
                 self.ensure_parent_dir(dst_path)
-                # Copy file with metadata
-                shutil.copy2(src_path, dst_path)
+                if (stat.S_ISREG(src_st.st_mode)
+                        and (dst_st is None or not stat.S_ISDIR(dst_st.st_mode))):
+                    self._copy_file(src_path, dst_path, src_st.st_size)
+                else:
+                    # Copy file with metadata
+                    shutil.copy2(src_path, dst_path)
 
+            self._paths_changed()
             logger.debug("Copied %s to %s", src_path, dst_path)
             return dst_path
         except Exception as e:
             logger.error("Error copying %s to %s: %s", src_path, dst_path, e)
             raise FileWriteError(str(dst_path), f"Error copying: {e}") from e
 
+    @staticmethod
+    def _copy_file(src_path: Path, dst_path: Path, size: int) -> None:
+        """
+        Copy a regular file with a kernel-side copy, preserving metadata.
+
+        Args:
+            src_path (Path): Source file.
+            dst_path (Path): Destination file.
+            size (int): Size of the source file.
+        """
+        import shutil
+
+        with open(src_path, "rb") as fsrc, open(dst_path, "wb") as fdst:
+            if not _kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+                shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(src_path, dst_path)
+
     def move(
         self, src: Union[str, Path], dst: Union[str, Path], overwrite: bool = False
     ) -> Path:
@@ -451,14 +977,17 @@ class FileManager:
             FileReadError: If the source cannot be read.
             FileWriteError: If the destination cannot be written.
         """
+        import shutil
+
         src_path = self._resolve_path(src)
         dst_path = self._resolve_path(dst)
 
-        if not src_path.exists():
+        if self._stat_once(src_path) is None:
             logger.error("Source does not exist: %s", str(src_path))
             raise FileReadError(str(src_path), "Source not found")
 
-        if dst_path.exists() and not overwrite:
+        dst_st = self._stat_once(dst_path)
+        if dst_st is not None and not overwrite:
             logger.error("Destination already exists: %s", str(dst_path))
             raise FileWriteError(str(dst_path), "Destination already exists")
 
@@ -467,8 +996,8 @@ class FileManager:
             self.ensure_parent_dir(dst_path)
 
             # Remove destination if it exists and overwrite is True
-            if dst_path.exists() and overwrite:
-                if dst_path.is_dir():
+            if dst_st is not None and overwrite:
+                if stat.S_ISDIR(dst_st.st_mode):
                     shutil.rmtree(dst_path)
                 else:
                     os.unlink(dst_path)
@@ -476,37 +1005,88 @@ class FileManager:
             # Move file or directory
             shutil.move(src_path, dst_path)
 
+            self._paths_changed()
             logger.debug("Moved %s to %s", src_path, dst_path)
             return dst_path
         except Exception as e:
             logger.error("Error moving %s to %s: %s", src_path, dst_path, e)
             raise FileWriteError(f"Error moving: {e}") from e
 
+    def _require_dir(self, dir_path: Path) -> None:
+        """
+        Ensure a path exists and is a directory.
+
+        Args:
+            dir_path (Path): Resolved path to check.
+
+        Raises:
+            FileReadError: If the path is missing or not a directory.
+        """
+        st = self._stat_once(dir_path)
+        if st is None:
+            logger.error("Directory does not exist: %s", dir_path)
+            raise FileReadError(str(dir_path), "Directory not found")
+
+        if not stat.S_ISDIR(st.st_mode):
+            logger.error("Path is not a directory: %s", dir_path)
+            raise FileReadError(str(dir_path), "Not a directory")
+
+    def scan_dir(self, path: Union[str, Path]) -> Iterator[os.DirEntry]:
+        """
+        Iterate over directory entries using os.scandir.
+
+        DirEntry objects carry the file type reported by the directory
+        listing and cache their stat result, so checking is_file()/is_dir()
+        or calling stat() on them avoids extra syscalls.
+
+        Args:
+            path (Union[str, Path]): Path to the directory.
+
+        Yields:
+            os.DirEntry: Entries in the directory.
+
+        Raises:
+            FileReadError: If the directory cannot be read.
+        """
+        dir_path = self._resolve_path(path)
+        self._require_dir(dir_path)
+
+        try:
+            with os.scandir(dir_path) as entries:
+                yield from entries
+        except OSError as e:
+            logger.error("Error scanning directory %s: %s", dir_path, e)
+            raise FileReadError(f"Error scanning directory: {e}") from e
+
     def list_dir(
-        self, path: Union[str, Path], pattern: Optional[str] = None
-    ) -> List[Path]:
+        self,
+        path: Union[str, Path],
+        pattern: Optional[str] = None,
+        raw: bool = False,
+    ) -> List[Union[Path, os.DirEntry]]:
         """
         List files and directories in a directory.
 
         Args:
             path (Union[str, Path]): Path to the directory.
-            pattern (str, optional): Glob pattern to filter results.
+            pattern (str, optional): Glob pattern to filter results. With
+                raw=True it is matched against entry names only.
+            raw (bool): Return os.DirEntry objects instead of Paths.
 
         Returns:
-            List[Path]: List of paths in the directory.
+            List[Union[Path, os.DirEntry]]: List of paths in the directory.
 
         Raises:
             FileReadError: If the directory cannot be read.
         """
-        dir_path = self._resolve_path(path)
-
-        if not dir_path.exists():
-            logger.error("Directory does not exist: %s", dir_path)
-            raise FileReadError(str(dir_path), "Directory not found")
+        if raw:
+            entries = self.scan_dir(path)
+            if pattern:
+                return [e for e in entries if fnmatch.fnmatch(e.name, pattern)]
+            return list(entries)
 
-        if not dir_path.is_dir():
-            logger.error("Path is not a directory: %s", dir_path)
-            raise FileReadError(str(dir_path), "Not a directory")
+        dir_path = self._resolve_path(path)
+        self._require_dir(dir_path)
 
         try:
             if pattern:
@@ -516,12 +1096,75 @@ class FileManager:
             logger.error("Error listing directory %s: %s", dir_path, e)
             raise FileReadError(f"Error listing directory: {e}") from e
 
-    def get_file_info(self, path: Union[str, Path]) -> Dict[str, Any]:
+    def _build_file_info(
+        self,
+        file_path: Path,
+        stat_result: os.stat_result,
+        include_hash: bool,
+        hash_size_limit: Optional[int] = HASH_SIZE_LIMIT,
+    ) -> Dict[str, Any]:
+        """
+        Build the file information dictionary from an existing stat result.
+
+        Args:
+            file_path (Path): Path to the file or directory.
+            stat_result (os.stat_result): Stat result for the path.
+            include_hash (bool): Whether to hash regular files.
+            hash_size_limit (int, optional): Files larger than this are not
+                hashed. None disables the limit.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing file information.
+        """
+        from datetime import datetime
+
+        is_file = stat.S_ISREG(stat_result.st_mode)
+
+        # Calculate file hash for regular files
+        file_hash = None
+        hash_skipped = None
+        if include_hash and is_file and file_path.suffix.lower() != ".enc":
+            if hash_size_limit is not None and stat_result.st_size > hash_size_limit:
+                hash_skipped = "too_large"
+            else:
+                try:
+                    file_hash = self.calculate_file_hash(file_path)
+                except (IOError, FileNotFoundError) as e:
+                    logger.error(
+                        "Error calculating file hash for %s: %s", file_path, e)
+                    # Don't fail if hash calculation fails
+
+        return {
+            "path": str(file_path),
+            "name": file_path.name,
+            "size": stat_result.st_size,
+            "is_file": is_file,
+            "is_dir": stat.S_ISDIR(stat_result.st_mode),
+            "created": datetime.fromtimestamp(stat_result.st_ctime),
+            "modified": datetime.fromtimestamp(stat_result.st_mtime),
+            "accessed": datetime.fromtimestamp(stat_result.st_atime),
+            "extension": file_path.suffix.lower() if is_file else None,
+            "hash": file_hash,
+            "hash_skipped": hash_skipped,
+        }
+
+    def get_file_info(
+        self,
+        path: Union[str, Path],
+        include_hash: bool = False,
+        hash_size_limit: Optional[int] = HASH_SIZE_LIMIT,
+    ) -> Dict[str, Any]:
         """
         Get information about a file or directory.
 
+        Hashing reads the whole file, so it is only done on request.
+
         Args:
             path (Union[str, Path]): Path to the file or directory.
+            include_hash (bool): Whether to hash regular files.
+            hash_size_limit (int, optional): Files larger than this are not
+                hashed and get ``hash_skipped == "too_large"``. None disables
+                the limit.
 
         Returns:
             Dict[str, Any]: Dictionary containing file information.
@@ -531,40 +1174,52 @@ class FileManager:
         """
         file_path = self._resolve_path(path)
 
-        if not file_path.exists():
+        stat_result = self._stat_once(file_path)
+        if stat_result is None:
             logger.error("Path does not exist: %s", file_path)
             raise FileReadError(str(file_path), "Path not found")
 
         try:
-            stat_result = file_path.stat()
-
-            # Calculate file hash for regular files
-            file_hash = None
-            if file_path.is_file() and file_path.suffix.lower() != ".enc":
-                try:
-                    file_hash = self.calculate_file_hash(file_path)
-                except (IOError, FileNotFoundError) as e:
-                    logger.error(
-                        "Error calculating file hash for %s: %s", file_path, e)
-                    # Don't fail if hash calculation fails
-
-            return {
-                "path": str(file_path),
-                "name": file_path.name,
-                "size": stat_result.st_size,
-                "is_file": file_path.is_file(),
-                "is_dir": file_path.is_dir(),
-                "created": datetime.fromtimestamp(stat_result.st_ctime),
-                "modified": datetime.fromtimestamp(stat_result.st_mtime),
-                "accessed": datetime.fromtimestamp(stat_result.st_atime),
-                "extension": file_path.suffix.lower() if file_path.is_file() else None,
-                "hash": file_hash,
-            }
+            return self._build_file_info(
+                file_path, stat_result, include_hash, hash_size_limit)
         except Exception as e:
             logger.error(
                 "Error getting file info for %s: %s", file_path, e)
             raise FileReadError(f"Error getting file info: {e}") from e
 
+    def get_many_file_info(
+        self, path: Union[str, Path], include_hash: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get information about every entry in a directory.
+
+        Walks the directory once with os.scandir and builds each dictionary
+        from the entry's cached stat result.
+
+        Args:
+            path (Union[str, Path]): Path to the directory.
+            include_hash (bool): Whether to hash regular files.
+
+        Returns:
+            List[Dict[str, Any]]: File information for each entry.
+
+        Raises:
+            FileReadError: If the directory or an entry cannot be read.
+        """
+        infos = []
+        for entry in self.scan_dir(path):
+            try:
+                infos.append(self._build_file_info(
+                    Path(entry.path), entry.stat(), include_hash))
+            except FileNotFoundError:
+                # Entry vanished between listing and stat
+                continue
+            except Exception as e:
+                logger.error(
+                    "Error getting file info for %s: %s", entry.path, e)
+                raise FileReadError(f"Error getting file info: {e}") from e
+        return infos
+
     def calculate_file_hash(
         self, path: Union[str, Path], algorithm: str = "sha256"
     ) -> str:
@@ -584,33 +1239,93 @@ class FileManager:
         """
         file_path = self._resolve_path(path)
 
-        if not file_path.exists():
+        st = self._stat_once(file_path)
+        if st is None:
             logger.error("File does not exist: %s", file_path)
             raise FileReadError(str(file_path), "File not found")
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.error("Path is not a file: %s", file_path)
             raise FileReadError(str(file_path), "Not a file")
 
         # Check if the algorithm is supported
         try:
-            hasher = getattr(hashlib, algorithm)()
-        except AttributeError:
+            # Content fingerprint, not a security check: skip the FIPS gate
+            hasher = hashlib.new(algorithm, usedforsecurity=False)
+        except ValueError:
             logger.error("Unsupported hash algorithm: %s", algorithm)
             raise ValueError(
-                f"Unsupported hash algorithm: {algorithm}") from AttributeError
+                f"Unsupported hash algorithm: {algorithm}") from None
 
         try:
-            with open(file_path, "rb") as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
+            # Unbuffered: file_digest and the chunk loop bring their own
+            # buffers, so the BufferedReader layer would only add a copy
+            with open(file_path, "rb", buffering=0) as f:
+                if st.st_size >= MMAP_THRESHOLD:
+                    # Hash the mapped pages directly: no read() per chunk and
+                    # no copy into intermediate bytes objects
+                    fadvise = hasattr(os, "posix_fadvise")
+                    if fadvise:
+                        _fadvise(f.fileno(), os.POSIX_FADV_SEQUENTIAL,
+                                 os.POSIX_FADV_WILLNEED)
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mm, "madvise"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hasher.update(mm)
+                    if fadvise:
+                        # One-shot scan: don't let it evict hot cached data
+                        _fadvise(f.fileno(), os.POSIX_FADV_DONTNEED)
+                elif hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: C readinto loop over one preallocated
+                    # buffer, hashing with the GIL released
+                    hashlib.file_digest(f, lambda: hasher)
+                else:
+                    # Read in chunks sized to the filesystem block size
+                    bufsize = max(1 << 20, getattr(st, "st_blksize", 4096) * 16)
+                    for chunk in iter(lambda: f.read(bufsize), b""):
+                        hasher.update(chunk)
             return hasher.hexdigest()
         except Exception as e:
             logger.error("Error calculating hash for %s: %s", file_path, e)
             raise FileReadError(
                 str(file_path), f"Error calculating hash: {e}") from e
 
+    def hash_many(
+        self,
+        paths: Iterable[Union[str, Path]],
+        algorithm: str = "sha256",
+        max_workers: int = 8,
+    ) -> Dict[Path, str]:
+        """
+        Calculate hashes of several files concurrently.
+
+        hashlib releases the GIL while hashing and file reads block in the
+        kernel, so a thread pool overlaps I/O and hashing across files.
+
+        Args:
+            paths (Iterable[Union[str, Path]]): Files to hash.
+            algorithm (str): Hash algorithm to use.
+            max_workers (int): Maximum number of worker threads.
+
+        Returns:
+            Dict[Path, str]: Hexadecimal hash keyed by resolved file path.
+
+        Raises:
+            FileReadError: If any of the files cannot be read.
+            ValueError: If the algorithm is not supported.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        file_paths = [self._resolve_path(p) for p in paths]
+        if len(file_paths) <= 1 or max_workers <= 1:
+            return {p: self.calculate_file_hash(p, algorithm) for p in file_paths}
+
+        workers = min(max_workers, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashes = executor.map(
+                lambda p: self.calculate_file_hash(p, algorithm), file_paths)
+            return dict(zip(file_paths, hashes))
+
     def get_temp_file(
         self,
         suffix: Optional[str] = None,
@@ -628,6 +1343,8 @@ class FileManager:
         Returns:
             tuple[Path, Callable[[], None]]: Path to the temporary file and a cleanup function.
         """
+        import tempfile
+
         if dir:
             dir_path = self._resolve_path(dir)
             self.ensure_dir(dir_path)
@@ -648,6 +1365,7 @@ class FileManager:
                 except:
                     pass
 
+            self._paths_changed()
             logger.debug("Temporary file created: %s", temp_path)
             return Path(temp_path), cleanup
         except Exception as e:
@@ -672,6 +1390,9 @@ class FileManager:
         Returns:
             tuple[Path, Callable[[], None]]: Path to the temporary directory and a cleanup function.
         """
+        import shutil
+        import tempfile
+
         if dir:
             dir_path = self._resolve_path(dir)
             self.ensure_dir(dir_path)
@@ -691,6 +1412,7 @@ class FileManager:
                 except:
                     pass
 
+            self._paths_changed()
             logger.debug("Temporary directory created: %s", temp_dir)
             return Path(temp_dir), cleanup
         except Exception as e:
@@ -708,25 +1430,40 @@ class SafeFileWriter:
     try to write to the same file.
     """
 
-    # Class variable for file locks
-    _file_locks = {}
+    # Class variable for file locks; a lock lives only while someone holds it
+    _file_locks: "WeakValueDictionary[str, threading.RLock]" = WeakValueDictionary()
     _lock = threading.RLock()
+    # Unique temp file suffixes, so concurrent writers never collide
+    _tmp_counter = itertools.count()
+    # Parent directories already created or found by safe_write
+    _known_dirs: set = set()
+
+    # Batched writes: path -> (content, mode, encoding) and flush deadline
+    _pending: Dict[str, tuple] = {}
+    _deadlines: Dict[str, float] = {}
+    _pending_cond = threading.Condition()
+    _flusher: Optional[threading.Thread] = None
 
     @classmethod
     def get_lock(cls, file_path: str) -> threading.RLock:
         """
         Get a lock for a specific file path.
 
+        Paths are resolved first, so relative and symlinked spellings of
+        the same file share one lock.
+
         Args:
             file_path (str): Path to the file.
 
         Returns:
             threading.RLock: Lock for the file.
         """
+        key = os.path.realpath(file_path)
         with cls._lock:
-            if file_path not in cls._file_locks:
-                cls._file_locks[file_path] = threading.RLock()
-            return cls._file_locks[file_path]
+            lock = cls._file_locks.get(key)
+            if lock is None:
+                lock = cls._file_locks[key] = threading.RLock()
+            return lock
 
     @classmethod
     def safe_write(
@@ -750,28 +1487,49 @@ class SafeFileWriter:
         Raises:
             FileWriteError: If the file cannot be written.
         """
+        import shutil
+
         path_str = str(path)
+
+        # Create parent directory if it doesn't exist; done before taking
+        # the lock, and only checked the first time a directory is seen
+        parent = os.path.dirname(os.path.abspath(path_str))
+        if parent not in cls._known_dirs:
+            try:
+                os.makedirs(parent, exist_ok=True)
+            except OSError as e:
+                logger.error("Error writing file %s: %s", path_str, e)
+                raise FileWriteError(path_str, str(e))
+            with cls._lock:
+                cls._known_dirs.add(parent)
+
+        temp_path = f"{path_str}.tmp.{os.getpid()}.{next(cls._tmp_counter)}"
         lock = cls.get_lock(path_str)
 
         with lock:
             try:
-                # Create parent directory if it doesn't exist
-                os.makedirs(os.path.dirname(
-                    os.path.abspath(path_str)), exist_ok=True)
-
                 # Make backup if requested
                 if make_backup and os.path.exists(path_str):
-                    backup_path = (
-                        f"{path_str}.bak.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                    )
-                    shutil.copy2(path_str, backup_path)
+                    backup_path = f"{path_str}.bak.{_backup_stamp()}"
+                    # A hard link is enough: os.replace below points path_str
+                    # at the new inode and the backup keeps the old one
+                    try:
+                        os.link(path_str, backup_path)
+                    except OSError:
+                        shutil.copy2(path_str, backup_path)
 
                 # Write to a temporary file
-                temp_path = f"{path_str}.tmp.{int(time.time())}"
                 kwargs = {
                     "encoding": encoding} if "b" not in mode and encoding else {}
 
-                with open(temp_path, mode, **kwargs) as f:
+                try:
+                    f = open(temp_path, mode, **kwargs)
+                except FileNotFoundError:
+                    # The cached directory was removed in the meantime
+                    os.makedirs(parent, exist_ok=True)
+                    f = open(temp_path, mode, **kwargs)
+
+                with f:
                     f.write(content)
                     f.flush()
                     os.fsync(f.fileno())  # Ensure data is written to disk
@@ -779,7 +1537,8 @@ class SafeFileWriter:
                 # Replace the original file with the temporary file
                 os.replace(temp_path, path_str)
 
-                logger.debug("File written safely: %s", path_str)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("File written safely: %s", path_str)
             except Exception as e:
                 logger.error("Error writing file %s: %s", path_str, e)
                 # Clean up temporary file if it exists
@@ -789,3 +1548,127 @@ class SafeFileWriter:
                     except:
                         pass
                 raise FileWriteError(path_str, str(e))
+
+    @classmethod
+    def safe_write_batched(
+        cls,
+        path: Union[str, Path],
+        content: Union[str, bytes],
+        mode: str = "w",
+        encoding: Optional[str] = "utf-8",
+        flush_threshold: int = 1 << 20,
+        max_delay_ms: int = 100,
+    ) -> None:
+        """
+        Queue a safe write that is flushed together with later writes.
+
+        Each write replaces the whole file, as with safe_write, so only the
+        last content queued for a path within the delay window reaches disk,
+        with a single temp-file + fsync + replace. A background thread
+        flushes each path max_delay_ms after its first pending write;
+        content of flush_threshold bytes or more is written immediately.
+        Use safe_write when the data must be on disk before returning.
+
+        Args:
+            path (Union[str, Path]): Path to the file.
+            content (Union[str, bytes]): Content to write.
+            mode (str): File mode ('w' or 'wb').
+            encoding (str, optional): Character encoding to use.
+            flush_threshold (int): Size in bytes, after encoding, at which
+                the write is flushed at once.
+            max_delay_ms (int): Maximum time a write stays pending.
+
+        Raises:
+            FileWriteError: If an immediate flush fails. Failures of
+                background flushes are logged.
+        """
+        path_str = str(path)
+        size = len(content)
+        # A character encodes to at most 4 bytes, so only encode text whose
+        # size the character count alone cannot settle
+        if isinstance(content, str) and size < flush_threshold <= size * 4:
+            size = len(content.encode(encoding or "utf-8", "replace"))
+        immediate = size >= flush_threshold
+        with cls._pending_cond:
+            if path_str not in cls._pending:
+                cls._deadlines[path_str] = time.monotonic() + max_delay_ms / 1000
+            cls._pending[path_str] = (content, mode, encoding)
+            if not immediate:
+                cls._start_flusher()
+                cls._pending_cond.notify()
+
+        if immediate:
+            cls.flush_pending(path_str)
+
+    @classmethod
+    def flush_pending(cls, path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Write out batched writes now.
+
+        Args:
+            path (Union[str, Path], optional): Only flush this path.
+                If None, flushes every pending write.
+
+        Raises:
+            FileWriteError: If a pending write cannot be written.
+        """
+        if path is not None:
+            paths = [str(path)]
+        else:
+            with cls._pending_cond:
+                paths = list(cls._pending)
+        for path_str in paths:
+            cls._flush_one(path_str)
+
+    @classmethod
+    def _flush_one(cls, path_str: str) -> None:
+        """
+        Write the pending content of one path, if any.
+
+        The per-path lock is held from taking the entry until the write is
+        done, so an older batch can never land after a newer one.
+
+        Args:
+            path_str (str): Path whose pending write to flush.
+        """
+        with cls.get_lock(path_str):
+            with cls._pending_cond:
+                entry = cls._pending.pop(path_str, None)
+                cls._deadlines.pop(path_str, None)
+            if entry is not None:
+                content, mode, encoding = entry
+                cls.safe_write(path_str, content, mode=mode, encoding=encoding)
+
+    @classmethod
+    def _start_flusher(cls) -> None:
+        """Start the background flush thread (caller holds _pending_cond)."""
+        if cls._flusher is not None and cls._flusher.is_alive():
+            return
+        import atexit
+
+        if cls._flusher is None:
+            # Daemon thread: make sure queued writes are not lost on exit
+            atexit.register(cls.flush_pending)
+        cls._flusher = threading.Thread(
+            target=cls._flush_loop, name="SafeFileWriter-flusher", daemon=True)
+        cls._flusher.start()
+
+    @classmethod
+    def _flush_loop(cls) -> None:
+        """Flush pending writes as their deadlines pass."""
+        while True:
+            with cls._pending_cond:
+                while not cls._deadlines:
+                    cls._pending_cond.wait()
+                now = time.monotonic()
+                next_due = min(cls._deadlines.values())
+                if next_due > now:
+                    cls._pending_cond.wait(next_due - now)
+                    continue
+                due = [p for p, t in cls._deadlines.items() if t <= now]
+
+            for path_str in due:
+                try:
+                    cls._flush_one(path_str)
+                except FileWriteError as e:
+                    logger.error("Batched write to %s failed: %s", path_str, e)
@@ -14,7 +14,7 @@ Features:
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 # Import custom exceptions first
 from core.exceptions import (
@@ -25,11 +25,13 @@ from core.exceptions import (
     DecryptionError,
 )
 
-# Import Encryptor class for type checking only
-from data.encryption import Encryptor
+# Import Encryptor class for type checking only; loaded lazily at runtime
+if TYPE_CHECKING:
+    from data.encryption import Encryptor
 
 # Import base file manager
 from .base_file_manager import FileManager
+from .json_file_manager import _HAS_ORJSON, _json_dumps, _json_loads
 
 
 # Setup logger
@@ -43,7 +45,7 @@ class EncryptedFileManager(FileManager):
     Provides methods to read and write encrypted files using the Encryptor class.
     """
 
-    def __init__(self, encryptor: Encryptor, base_dir: Optional[str] = None):
+    def __init__(self, encryptor: "Encryptor", base_dir: Optional[str] = None):
         """
         Initialize the EncryptedFileManager.
 
@@ -54,6 +56,9 @@ class EncryptedFileManager(FileManager):
         Raises:
             TypeError: If the provided encryptor is not an instance of Encryptor.
         """
+        # pylint: disable=import-outside-toplevel
+        from data.encryption import Encryptor
+
         super().__init__(base_dir)
 
         # Check if the provided object is valid
@@ -64,6 +69,12 @@ class EncryptedFileManager(FileManager):
             )
 
         self.encryptor = encryptor
+        # The encryptor is fixed for the manager's lifetime; bind its
+        # methods once instead of looking them up on every call
+        self._encrypt = encryptor.encrypt
+        self._decrypt = encryptor.decrypt
+        self._encrypt_bytes = encryptor.encrypt_bytes
+        self._decrypt_bytes = encryptor.decrypt_bytes
 
     def read_encrypted(self, path: Union[str, Path]) -> str:
         """
@@ -84,7 +95,7 @@ class EncryptedFileManager(FileManager):
 
         try:
             # Decrypt the content
-            return self.encryptor.decrypt(encrypted_content)
+            return self._decrypt(encrypted_content)
         except DecryptionError:
             # Re-raise DecryptionError without converting it
             raise
@@ -109,11 +120,12 @@ class EncryptedFileManager(FileManager):
         """
         try:
             # Encrypt the content
-            encrypted_content = self.encryptor.encrypt(content)
+            encrypted_content = self._encrypt(content)
 
             # Write to file
             self.write_text(path, encrypted_content, make_backup=make_backup)
-            logger.debug("Encrypted content written to %s", path)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Encrypted content written to %s", path)
         except EncryptionError:
             # Re-raise EncryptionError without converting it
             raise
@@ -122,6 +134,64 @@ class EncryptedFileManager(FileManager):
             raise EncryptionError(
                 f"Error encrypting or writing to {path}: {e}") from e
 
+    def read_encrypted_bytes(self, path: Union[str, Path]) -> bytes:
+        """
+        Read and decrypt an encrypted file to raw bytes.
+
+        Args:
+            path (Union[str, Path]): Path to the encrypted file.
+
+        Returns:
+            bytes: The decrypted content.
+
+        Raises:
+            FileReadError: If the file cannot be read.
+            DecryptionError: If the file cannot be decrypted.
+        """
+        # Read the encrypted token
+        encrypted_content = self.read_binary_copy(path)
+
+        try:
+            # Decrypt the content
+            return self._decrypt_bytes(encrypted_content)
+        except DecryptionError:
+            # Re-raise DecryptionError without converting it
+            raise
+        except Exception as e:
+            logger.error("Error decrypting %s: %s", path, e)
+            raise DecryptionError(f"Error decrypting {path}: {e}") from e
+
+    def write_encrypted_bytes(
+        self, path: Union[str, Path], data: bytes, make_backup: bool = False
+    ) -> None:
+        """
+        Encrypt raw bytes and write them to a file.
+
+        Args:
+            path (Union[str, Path]): Path to the file.
+            data (bytes): Content to encrypt and write.
+            make_backup (bool): Whether to make a backup of the existing file.
+
+        Raises:
+            FileWriteError: If the file cannot be written.
+            EncryptionError: If the content cannot be encrypted.
+        """
+        try:
+            # Encrypt the content
+            encrypted_content = self._encrypt_bytes(data)
+
+            # Write to file
+            self.write_binary(path, encrypted_content, make_backup=make_backup)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Encrypted content written to %s", path)
+        except (EncryptionError, FileWriteError):
+            # Let these exceptions pass through unchanged
+            raise
+        except Exception as e:
+            logger.error("Error encrypting or writing to %s: %s", path, e)
+            raise EncryptionError(
+                f"Error encrypting or writing to {path}: {e}") from e
+
     def read_encrypted_json(
         self, path: Union[str, Path], default: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -152,21 +222,25 @@ class EncryptedFileManager(FileManager):
             raise FileReadError(str(file_path), "File not found")
 
         try:
-            # Read and decrypt
-            decrypted_content = self.read_encrypted(file_path)
+            # Read and decrypt; JSON is parsed from bytes, no str in between
+            decrypted_content = self.read_encrypted_bytes(file_path)
 
             # Parse JSON
             try:
-                return json.loads(decrypted_content)
+                return _json_loads(decrypted_content)
             except json.JSONDecodeError as e:
                 logger.error(
                     "Invalid JSON in decrypted content of %s: %s", file_path, e)
                 raise FileFormatError(
                     str(file_path), f"Invalid JSON in decrypted content: {e}"
                 ) from e
+            finally:
+                # Don't keep the plaintext alive through the parsed result
+                # or a traceback
+                del decrypted_content
         except (FileReadError, DecryptionError) as e:
             # Log the error
-            logging.error("An error occurred: %s", str(e))
+            logger.error("An error occurred: %s", e)
             # Optionally re-raise the exception
             raise
 
@@ -180,6 +254,9 @@ class EncryptedFileManager(FileManager):
         """
         Encrypt and write JSON data to a file.
 
+        The plaintext layout is never visible on disk, so with orjson
+        installed any non-zero indent is written as 2 spaces.
+
         Args:
             path (Union[str, Path]): Path to the file.
             data (Dict[str, Any]): JSON data to encrypt and write.
@@ -193,15 +270,18 @@ class EncryptedFileManager(FileManager):
         """
         # Convert to JSON string
         try:
-            json_content = json.dumps(data, indent=indent, ensure_ascii=False)
+            if _HAS_ORJSON and indent:
+                indent = 2
+            json_content = _json_dumps(data, indent=indent)
         except TypeError as e:
             logger.error("Data is not JSON-serializable: %s", e)
             raise TypeError(f"Data is not JSON-serializable: {e}") from e
 
         try:
             # Encrypt and write
-            self.write_encrypted(path, json_content, make_backup=make_backup)
-            logger.debug("Encrypted JSON written to %s", path)
+            self.write_encrypted_bytes(path, json_content, make_backup=make_backup)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Encrypted JSON written to %s", path)
         except (EncryptionError, FileWriteError):
             # Let these exceptions pass through unchanged
             raise
@@ -85,6 +85,33 @@ class EncryptionAlgorithm(ABC):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt raw bytes.
+
+        The default goes through the text API; subclasses should override it
+        to avoid the decode/encode round trip.
+
+        Args:
+            data (bytes): UTF-8 data to encrypt
+
+        Returns:
+            bytes: The encrypted token
+        """
+        return self.encrypt(data.decode("utf-8")).encode("ascii")
+
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt an encrypted token to raw bytes.
+
+        Args:
+            encrypted_data (bytes): The encrypted token
+
+        Returns:
+            bytes: The decrypted UTF-8 data
+        """
+        return self.decrypt(encrypted_data.decode("ascii")).encode("utf-8")
+
 
 class FernetEncryption(EncryptionAlgorithm):
     """
@@ -145,6 +172,46 @@ class FernetEncryption(EncryptionAlgorithm):
             logger.error("Fernet decryption failed: %s", e)
             raise DecryptionError(f"Decryption failed: {e}") from e
 
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt raw bytes using Fernet.
+
+        Args:
+            data (bytes): The data to encrypt
+
+        Returns:
+            bytes: The encrypted data as a base64-encoded token
+        """
+        try:
+            return self.cipher.encrypt(data)
+        except Exception as e:
+            logger.error("Fernet encryption failed: %s", e)
+            raise EncryptionError(f"Fernet encryption failed: {e}") from e
+
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt a Fernet token to raw bytes.
+
+        Args:
+            encrypted_data (bytes): The encrypted token
+
+        Returns:
+            bytes: The decrypted data
+
+        Raises:
+            DecryptionError: If decryption fails (e.g., incorrect key, corrupted data)
+        """
+        try:
+            return self.cipher.decrypt(encrypted_data)
+        except InvalidToken as exc:
+            logger.error(
+                "Decryption failed: Invalid token. The key may be incorrect.")
+            raise DecryptionError(
+                "Invalid token. The key may be incorrect.") from exc
+        except Exception as e:
+            logger.error("Fernet decryption failed: %s", e)
+            raise DecryptionError(f"Decryption failed: {e}") from e
+
 
 class EncryptionKeyManager:
     """
@@ -450,6 +517,36 @@ class Encryptor:
         """
         return self.cipher.decrypt(encrypted_data)
 
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt raw bytes without a text round trip.
+
+        Args:
+            data (bytes): The data to encrypt
+
+        Returns:
+            bytes: The encrypted token
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        return self.cipher.encrypt_bytes(data)
+
+    def decrypt_bytes(self, encrypted_data: bytes) -> bytes:
+        """
+        Decrypt an encrypted token to raw bytes.
+
+        Args:
+            encrypted_data (bytes): The encrypted token
+
+        Returns:
+            bytes: The decrypted data
+
+        Raises:
+            DecryptionError: If decryption fails
+        """
+        return self.cipher.decrypt_bytes(encrypted_data)
+
     def encrypt_file(self,
                      input_file: str,
                      output_file: Optional[str] = None,
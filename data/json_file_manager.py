@@ -13,6 +13,10 @@ Features:
 
 import json
 import logging
+import math
+import re
+import uuid
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union, Tuple
 
@@ -25,18 +29,177 @@ from core.exceptions import (
 # Import base file manager
 from .base_file_manager import FileManager
 
-# Indicator if jsonschema is available
-_HAS_JSONSCHEMA = False
+# Indicator if orjson is available
+_HAS_ORJSON = False
 try:
-    import jsonschema
-    _HAS_JSONSCHEMA = True
+    import orjson
+    _HAS_ORJSON = True
 except ImportError:
-    # jsonschema not available - validation will raise ImportError when used
+    # orjson not available - fall back to the stdlib json parser
     pass
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# A run of 19+ digits may be an integer outside orjson's 64-bit range, which
+# it would parse as a float; such documents go to the stdlib parser
+_LONG_DIGITS = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}")
+
+
+def _orjson_option(indent: Optional[int]) -> Optional[int]:
+    """
+    Map an indent level to orjson options, if orjson can produce that layout.
+
+    Args:
+        indent (int, optional): Requested indentation level.
+
+    Returns:
+        Optional[int]: orjson option flags, or None to use the stdlib encoder.
+    """
+    if not _HAS_ORJSON or indent not in (None, 2):
+        return None
+    # Types the stdlib encoder rejects (datetimes, dataclasses) and
+    # subclasses of builtins are handed back as errors, so _orjson_dumps
+    # falls back to the stdlib encoder for them; non-str keys likewise
+    option = (orjson.OPT_PASSTHROUGH_DATETIME
+              | orjson.OPT_PASSTHROUGH_DATACLASS
+              | orjson.OPT_PASSTHROUGH_SUBCLASS)
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return option
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode the values orjson serializes natively but json does not.
+
+    Keeps both encoders accepting the same types: enum members are written
+    as their value and UUIDs as their canonical string.
+
+    Args:
+        obj (Any): Object the stdlib encoder cannot serialize.
+
+    Returns:
+        Any: A serializable replacement.
+
+    Raises:
+        TypeError: If the object is not serializable either way.
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(
+        f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def _has_non_finite(data: Any) -> bool:
+    """
+    Check whether data holds a NaN or infinite float at any depth.
+
+    Args:
+        data (Any): Data to inspect.
+
+    Returns:
+        bool: True if a non-finite float was found.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _orjson_dumps(data: Any, indent: Optional[int]) -> Optional[bytes]:
+    """
+    Serialize data with orjson, if it can produce exactly what json would.
+
+    Args:
+        data (Any): Data to serialize.
+        indent (int, optional): Indentation level.
+
+    Returns:
+        Optional[bytes]: The encoded document, or None when the stdlib
+            encoder must be used (layout, types, big ints, non-str keys or
+            non-finite floats).
+    """
+    option = _orjson_option(indent)
+    if option is None:
+        return None
+    try:
+        encoded = orjson.dumps(data, option=option)
+    except TypeError:
+        return None
+    # orjson writes NaN and Infinity as null where json writes them as is;
+    # only documents containing null can have been rewritten
+    if b"null" in encoded and _has_non_finite(data):
+        return None
+    return encoded
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and can reproduce the requested
+    indentation (compact or 2 spaces) for this data; otherwise the stdlib
+    encoder. Both accept and reject the same values.
+
+    Args:
+        data (Any): Data to serialize.
+        indent (int, optional): Indentation level.
+
+    Returns:
+        bytes: The encoded JSON document.
+
+    Raises:
+        TypeError: If the data is not JSON-serializable.
+    """
+    encoded = _orjson_dumps(data, indent)
+    if encoded is not None:
+        return encoded
+    return json.dumps(data, indent=indent, ensure_ascii=False,
+                      default=_json_default).encode("utf-8")
+
+
+def _json_loads(content: Union[str, bytes, memoryview]) -> Any:
+    """
+    Parse a JSON document, with orjson when it is installed.
+
+    Documents orjson would read differently from json are parsed by the
+    stdlib: those it rejects (e.g. NaN and Infinity, which json writes)
+    and those with integers that may exceed 64 bits.
+
+    Args:
+        content (Union[str, bytes, memoryview]): The JSON document.
+
+    Returns:
+        Any: The parsed data.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON (orjson's
+            error type subclasses it).
+    """
+    if _HAS_ORJSON:
+        long_digits = (_LONG_DIGITS_STR if isinstance(content, str)
+                       else _LONG_DIGITS)
+        if long_digits.search(content) is None:
+            try:
+                return orjson.loads(content)
+            except json.JSONDecodeError:
+                pass
+    if isinstance(content, memoryview):
+        # The stdlib parser only accepts str/bytes/bytearray
+        content = content.tobytes()
+    return json.loads(content)
+
 
 class JsonFileManager(FileManager):
     """
@@ -45,6 +208,9 @@ class JsonFileManager(FileManager):
     Provides methods to read, write, and validate JSON files.
     """
 
+    # jsonschema module once imported by validate_json; False if unavailable
+    _jsonschema = None
+
     def __init__(self, base_dir: Optional[str] = None, indent: int = 4):
         """
         Initialize the JsonFileManager.
@@ -55,16 +221,28 @@ class JsonFileManager(FileManager):
         """
         super().__init__(base_dir)
         self.indent = indent
+        # Parsed documents keyed by path: (st_mtime_ns, st_size, data)
+        self._json_cache: Dict[str, Tuple[int, int, Any]] = {}
 
     def read_json(
-        self, path: Union[str, Path], default: Optional[Dict[str, Any]] = None
+        self,
+        path: Union[str, Path],
+        default: Optional[Dict[str, Any]] = None,
+        cached: bool = False,
     ) -> Dict[str, Any]:
         """
         Read and parse a JSON file.
 
+        The file is parsed from its raw bytes rather than decoded to text
+        first. With orjson installed, large files are parsed straight from
+        the memory-mapped buffer returned by read_binary.
+
         Args:
             path (Union[str, Path]): Path to the JSON file.
             default (Dict[str, Any], optional): Default value to return if the file doesn't exist.
+            cached (bool): Reuse the previously parsed document while the
+                file's mtime and size are unchanged. The returned object is
+                shared with the cache and must not be modified.
 
         Returns:
             Dict[str, Any]: Parsed JSON data.
@@ -75,7 +253,8 @@ class JsonFileManager(FileManager):
         """
         file_path = self._resolve_path(path)
 
-        if not file_path.exists():
+        st = self._stat_once(file_path)
+        if st is None:
             if default is not None:
                 logger.debug(
                     "JSON file not found, returning default: %s", file_path)
@@ -83,19 +262,42 @@ class JsonFileManager(FileManager):
             logger.error("JSON file not found: %s", file_path)
             raise FileReadError(str(file_path), "File not found")
 
+        key = str(file_path)
+        if cached:
+            entry = self._json_cache.get(key)
+            if (entry is not None and entry[0] == st.st_mtime_ns
+                    and entry[1] == st.st_size):
+                return entry[2]
+
         try:
-            content = self.read_text(file_path)
-            return json.loads(content)
+            if _HAS_ORJSON:
+                data = _json_loads(self.read_binary(file_path))
+            else:
+                # The stdlib parser would copy a mapped buffer anyway
+                data = _json_loads(self.read_binary_copy(file_path))
+        except UnicodeDecodeError as e:
+            logger.error("Unicode decode error for %s: %s", file_path, e)
+            raise FileReadError(f"Unicode decode error: {e}") from e
         except json.JSONDecodeError as e:
             logger.error("Invalid JSON in %s: %s", file_path, e)
             raise FileFormatError(str(file_path), f"Invalid JSON: {e}") from e
 
+        if cached:
+            self._json_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
     def write_json(
         self, path: Union[str, Path], data: Dict[str, Any], make_backup: bool = False
     ) -> None:
         """
         Write data to a JSON file.
 
+        With orjson installed and an indent of None or 2, the document is
+        encoded to bytes in one C pass when orjson encodes it exactly as json
+        would. Otherwise it is encoded with
+        JSONEncoder.iterencode and streamed into the temporary file, so the
+        whole document is never held in memory as one string.
+
         Args:
             path (Union[str, Path]): Path to the JSON file.
             data (Dict[str, Any]): Data to write.
@@ -106,13 +308,22 @@ class JsonFileManager(FileManager):
             TypeError: If the data is not JSON-serializable.
         """
         file_path = self._resolve_path(path)
+        self._json_cache.pop(str(file_path), None)
 
         try:
-            # Convert to JSON string
-            json_content = json.dumps(
-                data, indent=self.indent, ensure_ascii=False)
-            # Write to file
-            self.write_text(file_path, json_content, make_backup=make_backup)
+            encoded = _orjson_dumps(data, self.indent)
+            if encoded is not None:
+                self.write_binary(file_path, encoded, make_backup=make_backup)
+            else:
+                encoder = json.JSONEncoder(indent=self.indent, ensure_ascii=False,
+                                           default=_json_default)
+
+                def _write_chunks(f) -> None:
+                    write = f.write
+                    for chunk in encoder.iterencode(data):
+                        write(chunk)
+
+                self.write_stream(file_path, _write_chunks, make_backup=make_backup)
             logger.debug("JSON written to %s", file_path)
         except TypeError as e:
             logger.error("Data is not JSON-serializable: %s", e)
@@ -136,8 +347,15 @@ class JsonFileManager(FileManager):
             FileFormatError: If the file is not valid JSON.
             ImportError: If jsonschema package is not available.
         """
-        # Check if jsonschema is available
-        if not _HAS_JSONSCHEMA:
+        # Import jsonschema on first use and remember the outcome
+        jsonschema = JsonFileManager._jsonschema
+        if jsonschema is None:
+            try:
+                import jsonschema  # pylint: disable=import-outside-toplevel
+            except ImportError:
+                jsonschema = False
+            JsonFileManager._jsonschema = jsonschema
+        if jsonschema is False:
             logger.error("jsonschema package is required for validation")
             raise ImportError("jsonschema package is required for validation")
 
@@ -168,6 +386,11 @@ class JsonFileManager(FileManager):
         """
         Merge a source JSON file into a target JSON file.
 
+        The target document is kept in the parse cache between calls, so
+        applying many overlays to one large file reads it only once. The
+        cache holds a parse of the bytes written rather than the returned
+        dict, so modifying the result does not affect the cache.
+
         Args:
             target_path (Union[str, Path]): Path to the target JSON file.
             source_path (Union[str, Path]): Path to the source JSON file.
@@ -181,20 +404,68 @@ class JsonFileManager(FileManager):
             FileFormatError: If either file is not valid JSON.
         """
         # Read both files
-        target_data = self.read_json(target_path, default={})
+        target_data = self.read_json(target_path, default={}, cached=True)
         source_data = self.read_json(source_path)
 
-        # Merge the data
+        # Merge into a new dict; the cached target must stay untouched
         if overwrite:
-            target_data.update(source_data)
+            merged = target_data | source_data
         else:
-            # Only add keys that don't exist in the target
-            for key, value in source_data.items():
-                if key not in target_data:
-                    target_data[key] = value
+            # Only add keys that don't exist in the target; the union keeps
+            # the target's key order and update() restores its values
+            merged = target_data | source_data
+            merged.update(target_data)
 
         # Write the merged data back to the target file
-        self.write_json(target_path, target_data, make_backup=True)
+        target_file = self._resolve_path(target_path)
+        key = str(target_file)
+        self._json_cache.pop(key, None)
+        try:
+            encoded = _json_dumps(merged, self.indent)
+        except TypeError as e:
+            logger.error("Data is not JSON-serializable: %s", e)
+            raise TypeError(f"Data is not JSON-serializable: {e}") from e
+        self.write_binary(target_file, encoded, make_backup=True)
 
-        logger.debug("Merged %s into %s", source_path, target_path)
-        return target_data
+        # Cache a parse of what was written for the next overlay; parsing is
+        # far cheaper than deep-copying, and `merged` stays the caller's
+        st = self._stat_once(target_file)
+        if st is not None:
+            self._json_cache[key] = (
+                st.st_mtime_ns, st.st_size, _json_loads(encoded))
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Merged %s into %s", source_path, target_path)
+        return merged
+
+    def delete(self, path: Union[str, Path], missing_ok: bool = False) -> bool:
+        """
+        Delete a file, dropping any cached parse of it.
+
+        Args:
+            path (Union[str, Path]): Path to the file to delete.
+            missing_ok (bool): If True, don't raise an error if the file doesn't exist.
+
+        Returns:
+            bool: True if the file was deleted, False if it didn't exist and missing_ok is True.
+        """
+        self._json_cache.pop(str(self._resolve_path(path)), None)
+        return super().delete(path, missing_ok)
+
+    def move(
+        self, src: Union[str, Path], dst: Union[str, Path], overwrite: bool = False
+    ) -> Path:
+        """
+        Move a file or directory, dropping cached parses of both paths.
+
+        Args:
+            src (Union[str, Path]): Source path.
+            dst (Union[str, Path]): Destination path.
+            overwrite (bool): Whether to overwrite the destination if it exists.
+
+        Returns:
+            Path: Path to the destination.
+        """
+        self._json_cache.pop(str(self._resolve_path(src)), None)
+        self._json_cache.pop(str(self._resolve_path(dst)), None)
+        return super().move(src, dst, overwrite)
@@ -6,12 +6,20 @@ It implements strategies for handling various error scenarios, including network
 API rate limits, account blocks, and other operational failures.
 """
 
-import time
-import random
+import asyncio
+import heapq
+import itertools
+import json
 import logging
+import queue
+import sqlite3
 import threading
-from enum import Enum, auto
-from typing import Any, Callable, Dict, Optional, TypeVar
+from random import random as _random, uniform as _uniform
+from time import monotonic as _monotonic, sleep as _sleep, time_ns as _time_ns
+from dataclasses import dataclass
+from enum import Enum, IntFlag, auto
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 
 from core.exceptions import (
     TelegramAdderError, AccountError, APIError,
@@ -35,7 +43,7 @@ T = TypeVar('T')
 # pylint: disable=missing-class-docstring
 
 
-class FallbackStrategy(Enum):
+class FallbackStrategy(IntFlag):
     RETRY = auto()
     SWITCH_ACCOUNT = auto()
     SWITCH_PROXY = auto()
@@ -44,6 +52,21 @@ class FallbackStrategy(Enum):
     CHECKPOINT = auto()
 
 
+# Module-level aliases for the strategies compared on hot paths
+_FS_RETRY = FallbackStrategy.RETRY
+_FS_WAIT = FallbackStrategy.WAIT_AND_RETRY
+_FS_ABORT = FallbackStrategy.ABORT
+_FS_SWITCH_ACC = FallbackStrategy.SWITCH_ACCOUNT
+_FS_SWITCH_PROXY = FallbackStrategy.SWITCH_PROXY
+_FS_CHECKPOINT = FallbackStrategy.CHECKPOINT
+
+# Strategies that are handled by waiting and trying the same call again
+_RETRY_MASK = _FS_RETRY | _FS_WAIT
+
+# Returned by fallback handlers that did not produce a result
+_NO_RESULT = object()
+
+
 class RecoveryState(Enum):
     NONE = auto()
     RUNNING = auto()
@@ -51,99 +74,328 @@ class RecoveryState(Enum):
     FAILED = auto()
 
 
+def _adaptive_sleep(delay: float) -> None:
+    # Spin through sub-millisecond delays instead of a scheduler round-trip
+    if delay < 0.001:
+        end = _monotonic() + delay
+        while _monotonic() < end:
+            pass
+    else:
+        _sleep(delay)
+
+
+@dataclass
+class _RecoveryRecord:
+    __slots__ = ("timestamp_ns", "data", "state")
+
+    timestamp_ns: int
+    data: Dict[str, Any]
+    state: RecoveryState
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            # Seconds, as recovery_data has always exposed them
+            "timestamp": self.timestamp_ns / 1e9,
+            "timestamp_ns": self.timestamp_ns,
+            "data": self.data,
+            "state": self.state
+        }
+
+
+@lru_cache(maxsize=32)
+def _is_flood_wait_type(error_type: type) -> bool:
+    return issubclass(error_type, FloodWaitError)
+
+
+class RecoveryStore:
+    """In-memory store for recovery records; subclasses persist them"""
+
+    def __init__(self):
+        self._records = {}
+
+    def put(self, operation_id: str, record: Dict[str, Any]) -> None:
+        self._records[operation_id] = record
+
+    def get(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        return self._records.get(operation_id)
+
+    def pop(self, operation_id: str) -> None:
+        self._records.pop(operation_id, None)
+
+    def contains(self, operation_id: str) -> bool:
+        return operation_id in self._records
+
+
+class SQLiteRecoveryStore(RecoveryStore):
+    """Recovery store backed by an SQLite file so records survive a restart"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS recovery ("
+            "op_id TEXT PRIMARY KEY, ts INTEGER, state BLOB, state_enum INT)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections may not be shared across threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, operation_id: str, record: Dict[str, Any]) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO recovery VALUES (?, ?, ?, ?)",
+            (operation_id, record["timestamp_ns"],
+             json.dumps(record["data"]).encode("utf-8"), record["state"].value)
+        )
+
+    def get(self, operation_id: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(
+            "SELECT ts, state, state_enum FROM recovery WHERE op_id = ?",
+            (operation_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "timestamp": row[0] / 1e9,
+            "timestamp_ns": int(row[0]),
+            "data": json.loads(row[1]),
+            "state": RecoveryState(row[2])
+        }
+
+    def pop(self, operation_id: str) -> None:
+        self._connection().execute(
+            "DELETE FROM recovery WHERE op_id = ?", (operation_id,))
+
+    def contains(self, operation_id: str) -> bool:
+        return self._connection().execute(
+            "SELECT 1 FROM recovery WHERE op_id = ?", (operation_id,)
+        ).fetchone() is not None
+
+
 class FallbackManager:
+    # "proportional" scales the exponential delay by a random 0.8-1.2;
+    # the others follow the usual full/equal/decorrelated jitter schemes
+    JITTER_MODES = ("proportional", "full", "equal", "decorrelated")
+
+    # Exponential backoff factors, capped at 10
+    _POW2 = tuple(min(2 ** i, 10) for i in range(32))
+
+    # Number of recovery lock stripes; must be a power of two
+    _LOCK_STRIPES = 16
+
+    # Adaptive retry budget
+    RETRY_TOKEN_CAP = 500.0
+    RETRY_TOKEN_COST = 5.0
+    RETRY_TOKEN_REFUND = 1.0
+
     def __init__(self,
                  max_retries: int = MAX_RETRY_COUNT,
                  base_delay: float = DEFAULT_DELAY,
-                 max_delay: float = MAX_DELAY):
+                 max_delay: float = MAX_DELAY,
+                 store: Optional[RecoveryStore] = None,
+                 jitter_mode: str = "proportional"):
+        if jitter_mode not in self.JITTER_MODES:
+            raise ValueError(f"Unknown jitter mode: {jitter_mode}")
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
-        self.retry_counts = {}
-        self.recovery_data = {}
-        self._lock = threading.RLock()
+        self.jitter_mode = jitter_mode
+        # Per-operation counters; updates are read-modify-write, so they
+        # hold the operation's lock stripe below
+        self.retry_counts: Dict[str, int] = {}
+        self._prev_delays: Dict[str, float] = {}
+        # Recovery points, written through to store if set
+        self._records: Dict[str, _RecoveryRecord] = {}
+        self.store = store
+        # Counter and multi-field recovery updates lock one of several
+        # stripes chosen by operation_id, so unrelated operations do not contend
+        self._locks = tuple(threading.Lock() for _ in range(self._LOCK_STRIPES))
+        # Shared retry budget: each retry spends tokens and each success
+        # refunds some, so sustained failure stops retries altogether
+        self._token_cap = self.RETRY_TOKEN_CAP
+        self._tokens = self._token_cap
+        self._token_lock = threading.Lock()
 
 # pylint: disable=missing-function-docstring
     def reset_retry_count(self, operation_id: str) -> None:
-        with self._lock:
-            if operation_id in self.retry_counts:
-                del self.retry_counts[operation_id]
+        with self._lock_for(operation_id):
+            self.retry_counts.pop(operation_id, None)
+            self._prev_delays.pop(operation_id, None)
 
     def get_retry_count(self, operation_id: str) -> int:
-        with self._lock:
-            return self.retry_counts.get(operation_id, 0)
+        return self.retry_counts.get(operation_id, 0)
 
     def increment_retry_count(self, operation_id: str) -> int:
-        with self._lock:
-            current = self.retry_counts.get(operation_id, 0)
-            self.retry_counts[operation_id] = current + 1
-            return self.retry_counts[operation_id]
+        with self._lock_for(operation_id):
+            count = self.retry_counts.get(operation_id, 0) + 1
+            self.retry_counts[operation_id] = count
+        return count
 
     def can_retry(self, operation_id: str) -> bool:
-        with self._lock:
-            return self.get_retry_count(operation_id) < self.max_retries
+        return self.retry_counts.get(operation_id, 0) < self.max_retries
 
     def calculate_delay(self, operation_id: str, error: Optional[Exception] = None) -> float:
-        retry_count = self.get_retry_count(operation_id)
-
-        if isinstance(error, FloodWaitError) and hasattr(error, 'seconds'):
-            return max(error.seconds, self.base_delay)
-
-        factor = min(2 ** retry_count, 10)  # Cap the exponential factor at 10
-        jitter = random.uniform(0.8, 1.2)  # Add 20% jitter
+        # FloodWait delays come from the server; skip the retry-count lookup
+        delay = self._flood_wait_delay(error)
+        if delay is not None:
+            return delay
+        return self._backoff_delay(operation_id, self.retry_counts.get(operation_id, 0))
+
+    def _delay_for(self, operation_id: str, retry_count: int,
+                   error: Optional[Exception] = None) -> float:
+        delay = self._flood_wait_delay(error)
+        if delay is not None:
+            return delay
+        return self._backoff_delay(operation_id, retry_count)
+
+    def _flood_wait_delay(self, error: Optional[Exception]) -> Optional[float]:
+        seconds = getattr(error, 'seconds', None)
+        if seconds is None:
+            return None
+        error_type = type(error)
+        if error_type is not FloodWaitError and not _is_flood_wait_type(error_type):
+            return None
+        return seconds if seconds > self.base_delay else self.base_delay
+
+    def _backoff_delay(self, operation_id: str, retry_count: int) -> float:
+        mode = self.jitter_mode
+        if mode == "decorrelated":
+            # Each delay grows from the previous one for this operation
+            prev = self._prev_delays.get(operation_id, self.base_delay)
+            delay = min(self.max_delay, _uniform(self.base_delay, prev * 3))
+            self._prev_delays[operation_id] = delay
+            return delay
+
+        if mode != "proportional":
+            # Full and equal jitter grow uncapped until max_delay
+            ceiling = min(self.max_delay,
+                          self.base_delay * (1 << min(retry_count, 62)))
+            if mode == "full":
+                return _uniform(0, ceiling)
+            half = ceiling / 2
+            return half + _uniform(0, half)
+
+        factor = self._POW2[retry_count] if retry_count < 32 else 10
+        jitter = 0.8 + 0.4 * _random()  # Add 20% jitter
 
         delay = min(self.base_delay * factor * jitter, self.max_delay)
         return delay
 
+    def try_acquire_retry_token(self) -> bool:
+        with self._token_lock:
+            if self._tokens >= self.RETRY_TOKEN_COST:
+                self._tokens -= self.RETRY_TOKEN_COST
+                return True
+            return False
+
+    def refund_retry_token(self) -> None:
+        with self._token_lock:
+            self._tokens = min(self._token_cap, self._tokens + self.RETRY_TOKEN_REFUND)
+
+    def record_failure(self, operation_id: str,
+                       error: Exception) -> Tuple[int, FallbackStrategy, float]:
+        """Count a failed attempt and return (retry_count, strategy, delay) in one call."""
+        strategy = _get_strategy(error)
+        with self._lock_for(operation_id):
+            retry_count = self.retry_counts.get(operation_id, 0) + 1
+            self.retry_counts[operation_id] = retry_count
+            # The decorrelated delay also reads and writes per-operation state
+            delay = self._delay_for(operation_id, retry_count, error)
+        return retry_count, strategy, delay
+
+    def _lock_for(self, operation_id: str) -> threading.Lock:
+        return self._locks[hash(operation_id) & (self._LOCK_STRIPES - 1)]
+
+    @property
+    def recovery_data(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot of in-memory recovery points as timestamp/data/state records"""
+        return {
+            operation_id: record.as_dict()
+            for operation_id, record in list(self._records.items())
+        }
+
     def save_recovery_point(self, operation_id: str, data: Dict[str, Any]) -> None:
-        with self._lock:
-            self.recovery_data[operation_id] = {
-                "timestamp": time.time(),
-                "data": data,
-                "state": RecoveryState.RUNNING
-            }
+        # Wall-clock nanoseconds, so persisted records stay meaningful after
+        # a restart; timestamp_ns keeps full precision next to timestamp
+        record = _RecoveryRecord(_time_ns(), data, RecoveryState.RUNNING)
+        with self._lock_for(operation_id):
+            self._records[operation_id] = record
+            if self.store is not None:
+                self.store.put(operation_id, record.as_dict())
+
+    def _load_from_store(self, operation_id: str) -> Optional["_RecoveryRecord"]:
+        # Caller holds the lock and has already missed in memory
+        if self.store is None:
+            return None
+        stored = self.store.get(operation_id)
+        if stored is None:
+            return None
+        record = _RecoveryRecord(stored["timestamp_ns"], stored["data"], stored["state"])
+        self._records[operation_id] = record
+        return record
 
+    # Reads of in-memory recovery points are lock-free and may briefly
+    # return a stale value; only a miss that goes to the store locks.
     def get_recovery_point(self, operation_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            recovery_info = self.recovery_data.get(operation_id)
-            if recovery_info:
-                return recovery_info.get("data")
-            return None
+        record = self._records.get(operation_id)
+        if record is None and self.store is not None:
+            with self._lock_for(operation_id):
+                record = (self._records.get(operation_id)
+                          or self._load_from_store(operation_id))
+        return record.data if record is not None else None
 
     def clear_recovery_point(self, operation_id: str) -> None:
-        with self._lock:
-            if operation_id in self.recovery_data:
-                del self.recovery_data[operation_id]
+        with self._lock_for(operation_id):
+            self._records.pop(operation_id, None)
+            if self.store is not None:
+                self.store.pop(operation_id)
 
     def mark_recovery_complete(self, operation_id: str, success: bool = True) -> None:
-        with self._lock:
-            if operation_id in self.recovery_data:
-                self.recovery_data[operation_id]["state"] = (
+        with self._lock_for(operation_id):
+            record = (self._records.get(operation_id)
+                      or self._load_from_store(operation_id))
+            if record is not None:
+                record.state = (
                     RecoveryState.RECOVERED if success else RecoveryState.FAILED
                 )
+                if self.store is not None:
+                    self.store.put(operation_id, record.as_dict())
 
     def has_recovery_point(self, operation_id: str) -> bool:
-        with self._lock:
-            return operation_id in self.recovery_data
+        if operation_id in self._records:
+            return True
+        return self.store is not None and self.store.contains(operation_id)
+
+    # Most specific class wins: get_fallback_strategy walks the error's MRO
+    # and returns the first entry found here.
+    _STRATEGY_MAP = {
+        FloodWaitError: FallbackStrategy.WAIT_AND_RETRY,
+        PeerFloodError: FallbackStrategy.SWITCH_ACCOUNT,
+        NetworkError: FallbackStrategy.SWITCH_PROXY,
+        SessionExpiredError: FallbackStrategy.SWITCH_ACCOUNT,
+        APIError: FallbackStrategy.RETRY,
+        AccountError: FallbackStrategy.SWITCH_ACCOUNT,
+        TelegramAdderError: FallbackStrategy.RETRY,
+    }
 
     @staticmethod
     def get_fallback_strategy(error: Exception) -> FallbackStrategy:
-        if isinstance(error, FloodWaitError):
-            return FallbackStrategy.WAIT_AND_RETRY
-        elif isinstance(error, PeerFloodError):
-            return FallbackStrategy.SWITCH_ACCOUNT
-        elif isinstance(error, NetworkError):
-            return FallbackStrategy.SWITCH_PROXY
-        elif isinstance(error, SessionExpiredError):
-            return FallbackStrategy.SWITCH_ACCOUNT
-        elif isinstance(error, APIError):
-            return FallbackStrategy.RETRY
-        elif isinstance(error, AccountError):
-            return FallbackStrategy.SWITCH_ACCOUNT
-        elif isinstance(error, TelegramAdderError):
-            return FallbackStrategy.RETRY
-        else:
-            return FallbackStrategy.ABORT
+        # Most errors are raised as one of the mapped classes exactly
+        error_type = type(error)
+        strategy = FallbackManager._STRATEGY_MAP.get(error_type)
+        if strategy is not None:
+            return strategy
+        return _strategy_for_type(error_type)
+
+
+# Bound once so the error path skips the instance attribute lookup
+_get_strategy = FallbackManager.get_fallback_strategy
 
 # pylint: disable=missing-function-docstring
 
@@ -159,50 +411,60 @@ def retry_operation(
     **kwargs
 ) -> T:
     if fallback_manager is None:
+        # A fresh manager has no retry count to reset; it keeps this call's
+        # count and backoff, while retries spend the shared manager's budget
         fallback_manager = FallbackManager(
             max_retries=max_retries, base_delay=base_delay)
+        budget = get_fallback_manager()
+    else:
+        fallback_manager.reset_retry_count(operation_id)
+        budget = fallback_manager
 
-    fallback_manager.reset_retry_count(operation_id)
     last_error = None
+    # The count starts at zero either way; after that record_failure
+    # returns it, so no per-attempt lookup is needed
+    retry_count = 0
+    retry_limit = fallback_manager.max_retries
 
-    while fallback_manager.can_retry(operation_id):
+    while retry_count < retry_limit:
         try:
             result = func(*args, **kwargs)
             # Success, reset retry count and return result
             fallback_manager.reset_retry_count(operation_id)
+            budget.refund_retry_token()
             return result
         except (ValueError, TypeError, AttributeError) as e:
             last_error = e
-            retry_count = fallback_manager.increment_retry_count(operation_id)
+            retry_count, strategy, delay = fallback_manager.record_failure(
+                operation_id, e)
 
             # Log the error
-            logger.warning(
-                "Operation %s failed (attempt %s/%s): %s",
-                operation_id,
-                retry_count,
-                max_retries,
-                str(e)
-            )
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Operation %s failed (attempt %s/%s): %s",
+                    operation_id,
+                    retry_count,
+                    max_retries,
+                    e
+                )
             # Call error callback if provided
             if error_callback:
                 error_callback(e, retry_count)
 
-            # Get fallback strategy
-            strategy = fallback_manager.get_fallback_strategy(e)
-
-            if strategy == FallbackStrategy.ABORT:
+            if strategy is _FS_ABORT:
                 break
 
-            # Calculate delay for retry
-            delay = fallback_manager.calculate_delay(operation_id, e)
-
-            if strategy == FallbackStrategy.RETRY or strategy == FallbackStrategy.WAIT_AND_RETRY:
-                logger.info(
-                    "Retrying operation %s in %.2f seconds...",
-                    operation_id,
-                    delay
-                )
-                time.sleep(delay)
+            if strategy & _RETRY_MASK:
+                if not budget.try_acquire_retry_token():
+                    raise OperationError(
+                        "adaptive retry budget exhausted") from e
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Retrying operation %s in %.2f seconds...",
+                        operation_id,
+                        delay
+                    )
+                _adaptive_sleep(delay)
             else:
                 # For other strategies, we need to let the caller handle it
                 break
@@ -216,17 +478,155 @@ def retry_operation(
         f"Unexpected error in retry_operation for {operation_id}")
 
 
+async def retry_operation_async(
+    func: Callable[..., Awaitable[T]],
+    operation_id: str,
+    *args,
+    fallback_manager: Optional[FallbackManager] = None,
+    max_retries: int = MAX_RETRY_COUNT,
+    base_delay: float = DEFAULT_DELAY,
+    error_callback: Optional[Callable[[Exception, int], None]] = None,
+    **kwargs
+) -> T:
+    """Coroutine counterpart of retry_operation that waits with asyncio.sleep"""
+    if fallback_manager is None:
+        fallback_manager = FallbackManager(
+            max_retries=max_retries, base_delay=base_delay)
+        budget = get_fallback_manager()
+    else:
+        fallback_manager.reset_retry_count(operation_id)
+        budget = fallback_manager
+
+    last_error = None
+    # The count starts at zero either way; after that record_failure
+    # returns it, so no per-attempt lookup is needed
+    retry_count = 0
+    retry_limit = fallback_manager.max_retries
+
+    while retry_count < retry_limit:
+        try:
+            result = await func(*args, **kwargs)
+            fallback_manager.reset_retry_count(operation_id)
+            budget.refund_retry_token()
+            return result
+        except (ValueError, TypeError, AttributeError) as e:
+            last_error = e
+            retry_count, strategy, delay = fallback_manager.record_failure(
+                operation_id, e)
+
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "Operation %s failed (attempt %s/%s): %s",
+                    operation_id,
+                    retry_count,
+                    max_retries,
+                    e
+                )
+            if error_callback:
+                error_callback(e, retry_count)
+
+            if strategy & _RETRY_MASK:
+                if not budget.try_acquire_retry_token():
+                    raise OperationError(
+                        "adaptive retry budget exhausted") from e
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Retrying operation %s in %.2f seconds...",
+                        operation_id,
+                        delay
+                    )
+                await asyncio.sleep(delay)
+            else:
+                break
+
+    if last_error:
+        raise last_error
+
+    raise RuntimeError(
+        f"Unexpected error in retry_operation_async for {operation_id}")
+
+
+class _DeferredCall:
+    __slots__ = ("callback", "cancelled", "lock")
+
+    def __init__(self, callback: Callable[[], None]):
+        self.callback = callback
+        self.cancelled = False
+        self.lock = threading.Lock()
+
+    def run(self) -> None:
+        with self.lock:
+            if not self.cancelled:
+                self.callback()
+
+    def cancel(self) -> None:
+        # Once this returns the callback has either finished or never runs
+        with self.lock:
+            self.cancelled = True
+
+
+class _Watchdog:
+    """Runs deferred calls on one shared thread instead of a Timer per call"""
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> _DeferredCall:
+        call = _DeferredCall(callback)
+        with self._cond:
+            heapq.heappush(self._heap, (_monotonic() + delay, next(self._counter), call))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="recovery-watchdog", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return call
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    # Drop cancelled calls so fast successes do not pile up
+                    while self._heap and self._heap[0][2].cancelled:
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    timeout = self._heap[0][0] - _monotonic()
+                    if timeout <= 0:
+                        call = heapq.heappop(self._heap)[2]
+                        break
+                    self._cond.wait(timeout)
+            try:
+                call.run()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Deferred recovery capture failed")
+
+
+_watchdog = _Watchdog()
+
+
 def with_recovery(
     func: Callable[..., T],
     operation_id: str,
     get_state_func: Callable[..., Dict[str, Any]],
     *args,
     fallback_manager: Optional[FallbackManager] = None,
+    capture_after: float = 1.0,
     **kwargs
 ) -> T:
+    """Run func, keeping a recovery point while it runs and after it fails.
+
+    The running state is only captured if func is still going after
+    capture_after seconds, so quick successes never call get_state_func.
+    A capture_after of 0 or less captures it up front.
+    """
 
     if fallback_manager is None:
-        fallback_manager = FallbackManager()
+        fallback_manager = get_fallback_manager()
 
     # Check if we have a recovery point for this operation
     if fallback_manager.has_recovery_point(operation_id):
@@ -239,13 +639,21 @@ def with_recovery(
             # Update kwargs with recovery data
             kwargs.update(recovery_data)
 
+    def _capture_state():
+        fallback_manager.save_recovery_point(
+            operation_id, get_state_func(*args, **kwargs))
+
+    deferred = None
     try:
-        # Capture the state periodically during execution
-        current_state = get_state_func(*args, **kwargs)
-        fallback_manager.save_recovery_point(operation_id, current_state)
+        if capture_after > 0:
+            deferred = _watchdog.schedule(capture_after, _capture_state)
+        else:
+            _capture_state()
 
         # Execute the operation
         result = func(*args, **kwargs)
+        if deferred is not None:
+            deferred.cancel()
 
         # Mark recovery as complete and clear the recovery point
         fallback_manager.mark_recovery_complete(operation_id, success=True)
@@ -254,11 +662,13 @@ def with_recovery(
         return result
 
     except Exception as e:
+        if deferred is not None:
+            deferred.cancel()
         # Handle the exception, save the state for recovery
         logger.error(
             "Operation %s failed with error: %s",
             operation_id,
-            str(e)
+            e
         )
 
         try:
@@ -270,7 +680,7 @@ def with_recovery(
         except (ValueError, TypeError, AttributeError) as state_error:
             logger.error(
                 "Failed to capture state for recovery: %s",
-                str(state_error)
+                state_error
             )
 
         # Re-raise the original exception
@@ -286,44 +696,59 @@ class RetryContext:
         self.operation_id = operation_id
         self.fallback_manager = FallbackManager(
             max_retries, base_delay, max_delay)
+        # Retries spend the shared manager's budget, like retry_operation
+        self._budget = get_fallback_manager()
         self.current_attempt = 0
         self.error = None
         self.strategy = None
+        # Monotonic time before which the next attempt must not start
+        self._next_attempt_at = 0.0
+
+    def _remaining_delay(self) -> float:
+        remaining = self._next_attempt_at - _monotonic()
+        self._next_attempt_at = 0.0
+        return remaining
 
     def __enter__(self):
+        # Wait out whatever is left of the retry delay; time the caller
+        # spent elsewhere since the failure counts towards it
+        remaining = self._remaining_delay()
+        if remaining > 0:
+            _adaptive_sleep(remaining)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is not None:
+        if exc_type is None:
+            self._budget.refund_retry_token()
+        else:
             self.error = exc_val
-            self.current_attempt = self.fallback_manager.increment_retry_count(
-                self.operation_id)
-            self.strategy = self.fallback_manager.get_fallback_strategy(
-                exc_val)
+            self.current_attempt, self.strategy, delay = (
+                self.fallback_manager.record_failure(self.operation_id, exc_val))
 
             # Determine if we should suppress the exception and retry
             if self.should_retry():
-                delay = self.fallback_manager.calculate_delay(
-                    self.operation_id, exc_val)
-                logger.info(
-                    "Retrying operation %s in %.2f seconds...",
-                    self.operation_id,
-                    delay
-                )
-                time.sleep(delay)
+                if not self._budget.try_acquire_retry_token():
+                    raise OperationError(
+                        "adaptive retry budget exhausted") from exc_val
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Retrying operation %s in %.2f seconds...",
+                        self.operation_id,
+                        delay
+                    )
+                self._next_attempt_at = _monotonic() + delay
                 return True  # Suppress the exception
 
         return False  # Don't suppress the exception
 
     def should_retry(self):
         # Check if we have retries left and the strategy is retry-compatible
-        can_retry = self.fallback_manager.can_retry(self.operation_id)
-        is_retry_strategy = (self.strategy == FallbackStrategy.RETRY or
-                             self.strategy == FallbackStrategy.WAIT_AND_RETRY)
-        return can_retry and is_retry_strategy
+        return (self.fallback_manager.can_retry(self.operation_id) and
+                self.strategy is not None and bool(self.strategy & _RETRY_MASK))
 
     def reset(self):
         self.fallback_manager.reset_retry_count(self.operation_id)
+        self._next_attempt_at = 0.0
         self.current_attempt = 0
         self.error = None
         self.strategy = None
@@ -337,31 +762,140 @@ class RetryContext:
         return self.fallback_manager.get_retry_count(self.operation_id)
 
 
+class AsyncRetryContext(RetryContext):
+    """RetryContext for coroutines; waits with asyncio.sleep instead of blocking"""
+
+    async def __aenter__(self):
+        remaining = self._remaining_delay()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self._budget.refund_retry_token()
+        else:
+            self.error = exc_val
+            self.current_attempt, self.strategy, delay = (
+                self.fallback_manager.record_failure(self.operation_id, exc_val))
+
+            if self.should_retry():
+                if not self._budget.try_acquire_retry_token():
+                    raise OperationError(
+                        "adaptive retry budget exhausted") from exc_val
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Retrying operation %s in %.2f seconds...",
+                        self.operation_id,
+                        delay
+                    )
+                self._next_attempt_at = _monotonic() + delay
+                return True  # Suppress the exception
+
+        return False  # Don't suppress the exception
+
+
 class OperationCheckpoint:
+    # Background saves from every instance go through one shared writer
+    # thread, which coalesces queued states down to the latest per operation
+    _save_queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+    _writer: Optional[threading.Thread] = None
+    _writer_lock = threading.Lock()
+
     def __init__(self,
                  operation_id: str,
                  checkpoint_interval: int = 10,
                  save_func: Optional[Callable[[Dict[str, Any]], None]] = None,
-                 load_func: Optional[Callable[[], Dict[str, Any]]] = None):
+                 load_func: Optional[Callable[[], Dict[str, Any]]] = None,
+                 fallback_manager: Optional[FallbackManager] = None,
+                 background_save: bool = False):
         self.operation_id = operation_id
         self.checkpoint_interval = checkpoint_interval
         self.save_func = save_func
         self.load_func = load_func
-        self.fallback_manager = FallbackManager()
+        self.fallback_manager = fallback_manager or get_fallback_manager()
         self.item_count = 0
+        # Items left until the next save; avoids a modulo per checkpoint
+        self._until_save = checkpoint_interval
+        # With background_save, save_func runs on the shared writer thread
+        self.background_save = background_save
 
     def checkpoint(self, state: Dict[str, Any]):
         self.item_count += 1
+        remaining = self._until_save - 1
 
         # Save checkpoint if we've hit the interval
-        if self.item_count % self.checkpoint_interval == 0:
+        if remaining:
+            self._until_save = remaining
+        else:
+            self._until_save = self.checkpoint_interval
             self.fallback_manager.save_recovery_point(self.operation_id, state)
 
             if self.save_func:
+                if self.background_save:
+                    self._enqueue_save(dict(state))
+                else:
+                    self._run_save(state)
+
+    def _run_save(self, state: Dict[str, Any]) -> None:
+        try:
+            self.save_func(state)
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.error("Error saving checkpoint: %s", e)
+
+    def _enqueue_save(self, state: Dict[str, Any]) -> None:
+        cls = type(self)
+        if cls._writer is None:
+            with cls._writer_lock:
+                if cls._writer is None:
+                    cls._writer = threading.Thread(
+                        target=OperationCheckpoint._writer_loop,
+                        name="checkpoint-writer",
+                        daemon=True
+                    )
+                    cls._writer.start()
+        cls._save_queue.put((self.operation_id, self.save_func, state))
+
+    @classmethod
+    def _writer_loop(cls) -> None:
+        while True:
+            batch = [cls._save_queue.get()]
+            try:
+                while True:
+                    batch.append(cls._save_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            # Keep only the latest state per (operation, save_func); flush
+            # markers are released after everything queued before them
+            latest = {}
+            markers = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    markers.append(item)
+                else:
+                    operation_id, save_func, state = item
+                    latest[(operation_id, save_func)] = state
+
+            for (_, save_func), state in latest.items():
                 try:
-                    self.save_func(state)
-                except (ValueError, TypeError, AttributeError) as e:
-                    logger.error("Error saving checkpoint: %s", str(e))
+                    save_func(state)
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Error saving checkpoint in background")
+
+            for marker in markers:
+                marker.set()
+
+    def flush(self) -> None:
+        """Block until background saves queued so far have been written"""
+        if type(self)._writer is not None:
+            marker = threading.Event()
+            type(self)._save_queue.put(marker)
+            marker.wait()
+
+    def close(self) -> None:
+        """Flush pending background saves; the shared writer keeps running"""
+        self.flush()
 
 # pylint: disable=missing-function-docstring
 
@@ -374,7 +908,7 @@ class OperationCheckpoint:
             try:
                 state = self.load_func()
             except (ValueError, TypeError, AttributeError) as e:
-                logger.error("Error loading checkpoint: %s", str(e))
+                logger.error("Error loading checkpoint: %s", e)
 
         return state
 # pylint: disable=missing-function-docstring
@@ -382,11 +916,22 @@ class OperationCheckpoint:
     def clear_checkpoints(self):
         self.fallback_manager.clear_recovery_point(self.operation_id)
         self.item_count = 0
+        self._until_save = self.checkpoint_interval
+
+
+@lru_cache(maxsize=128)
+def _strategy_for_type(error_type: type) -> FallbackStrategy:
+    strategy_map = FallbackManager._STRATEGY_MAP  # pylint: disable=protected-access
+    for cls in error_type.__mro__[1:]:
+        strategy = strategy_map.get(cls)
+        if strategy is not None:
+            return strategy
+    return _FS_ABORT
 
 
 def switch_account_fallback(retry_func, account_provider, error, *args, **kwargs):
     """Use with error handlers to automatically switch accounts on certain errors"""
-    logger.info("Switching account due to error: %s", str(error))
+    logger.info("Switching account due to error: %s", error)
 
     try:
         # Get next available account from provider
@@ -403,7 +948,7 @@ def switch_account_fallback(retry_func, account_provider, error, *args, **kwargs
         # Retry with new account
         return retry_func(*args, **kwargs)
     except Exception as e:
-        logger.error("Account switch fallback failed: %s", str(e))
+        logger.error("Account switch fallback failed: %s", e)
         raise
 
 
@@ -415,11 +960,11 @@ def emergency_shutdown(operation_id: str,
     logger.critical(
         "EMERGENCY SHUTDOWN for operation %s: %s",
         operation_id,
-        str(error)
+        error
     )
 
-    # Create a fallback manager to store the state
-    fallback_manager = FallbackManager()
+    # Store the state in the shared manager so it can be recovered later
+    fallback_manager = get_fallback_manager()
 
     try:
         # Save the current state for later recovery
@@ -435,53 +980,99 @@ def emergency_shutdown(operation_id: str,
             operation_id
         )
     except (ValueError, TypeError, AttributeError) as e:
-        logger.critical("Failed to complete emergency shutdown: %s", str(e))
+        logger.critical("Failed to complete emergency shutdown: %s", e)
 
 
-def get_fallback_manager():
-    """Get singleton instance of FallbackManager"""
-    return FallbackManager()
+_singleton_manager: Optional[FallbackManager] = None
+_singleton_lock = threading.Lock()
 
 
-def retry_with_fallback_strategies(func, operation_id, fallback_strategies, *args, **kwargs):
+def get_fallback_manager() -> FallbackManager:
+    """Get singleton instance of FallbackManager"""
+    global _singleton_manager  # pylint: disable=global-statement
+    manager = _singleton_manager
+    if manager is None:
+        with _singleton_lock:
+            manager = _singleton_manager
+            if manager is None:
+                _singleton_manager = manager = FallbackManager()
+    return manager
+
+
+# Fallback strategy handlers share one signature so they can be dispatched
+# from a table; they return _NO_RESULT to move on to the next strategy.
+# pylint: disable=unused-argument
+def _do_retry(func, operation_id, fallback_manager, args, kwargs, last_error):
+    return retry_operation(func, operation_id, *args,
+                           fallback_manager=fallback_manager, **kwargs)
+
+
+def _do_switch_account(func, operation_id, fallback_manager, args, kwargs, last_error):
+    # This assumes an account_provider is in kwargs
+    return switch_account_fallback(
+        func, kwargs.get('account_provider'), last_error, *args, **kwargs)
+
+
+def _do_switch_proxy(func, operation_id, fallback_manager, args, kwargs, last_error):
+    # Similar to switch_account but for proxies
+    # Implementation would depend on proxy manager
+    logger.info("Switching proxy and retrying...")
+    # TODO: Implement custom proxy switching logic here
+    return _NO_RESULT
+
+
+def _do_checkpoint(func, operation_id, fallback_manager, args, kwargs, last_error):
+    # Try to restore from checkpoint, falling back to a load_func in kwargs
+    state = fallback_manager.get_recovery_point(operation_id)
+    load_func = kwargs.get('load_func')
+    if state is None and callable(load_func):
+        try:
+            state = load_func()
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.error("Error loading checkpoint: %s", e)
+            state = None
+    if not state:
+        return _NO_RESULT
+    logger.info("Restoring from checkpoint for %s", operation_id)
+    # Update kwargs with checkpoint state
+    kwargs.update(state)
+    return func(*args, **kwargs)
+
+
+_STRATEGY_HANDLERS = {
+    _FS_RETRY: _do_retry,
+    _FS_SWITCH_ACC: _do_switch_account,
+    _FS_SWITCH_PROXY: _do_switch_proxy,
+    _FS_CHECKPOINT: _do_checkpoint,
+}
+
+
+def retry_with_fallback_strategies(func, operation_id, fallback_strategies, *args,
+                                   fallback_manager: Optional[FallbackManager] = None,
+                                   **kwargs):
     """Retry an operation with multiple fallback strategies in sequence"""
-    fallback_manager = FallbackManager()
+    if fallback_manager is None:
+        fallback_manager = get_fallback_manager()
     last_error = None
 
     # Try each strategy in sequence
     for strategy in fallback_strategies:
+        if strategy is _FS_ABORT:
+            logger.warning("Aborting operation %s", operation_id)
+            break
+        handler = _STRATEGY_HANDLERS.get(strategy)
+        if handler is None:
+            continue
         try:
             # Reset retry count for each strategy
             fallback_manager.reset_retry_count(operation_id)
-
-            if strategy == FallbackStrategy.RETRY:
-                return retry_operation(func, operation_id, fallback_manager, *args, **kwargs)
-            elif strategy == FallbackStrategy.SWITCH_ACCOUNT:
-                # This assumes an account_provider is in kwargs
-                return switch_account_fallback(
-                    func, kwargs.get('account_provider'), last_error, *args, **kwargs)
-            elif strategy == FallbackStrategy.SWITCH_PROXY:
-                # Similar to switch_account but for proxies
-                # Implementation would depend on proxy manager
-                logger.info("Switching proxy and retrying...")
-                # TODO: Implement custom proxy switching logic here
-            elif strategy == FallbackStrategy.CHECKPOINT:
-                # Try to restore from checkpoint
-                checkpoint = OperationCheckpoint(operation_id)
-                state = checkpoint.load_last_checkpoint()
-                if state:
-                    logger.info(
-                        "Restoring from checkpoint for %s", operation_id)
-                    # Update kwargs with checkpoint state
-                    kwargs.update(state)
-                    return func(*args, **kwargs)
-            elif strategy == FallbackStrategy.ABORT:
-                logger.warning("Aborting operation %s", operation_id)
-                break
-
+            result = handler(func, operation_id, fallback_manager,
+                             args, kwargs, last_error)
+            if result is not _NO_RESULT:
+                return result
         except (ValueError, TypeError, AttributeError) as e:
             last_error = e
-            logger.warning("Fallback strategy %s failed: %s", strategy, str(e))
+            logger.warning("Fallback strategy %s failed: %s", strategy, e)
 
     # If we get here, all strategies failed
     if last_error:
@@ -27,12 +27,14 @@ Usage:
 
 import logging
 import json
+import math
 import re
-import traceback
+import time
 from datetime import datetime
 import socket
 import platform
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional
 
 try:
@@ -42,6 +44,67 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _has_non_finite(data) -> bool:
+    """
+    Check whether data holds a NaN or infinite float at any depth.
+
+    Args:
+        data: Data to inspect.
+
+    Returns:
+        bool: True if a non-finite float was found.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def _json_dumps(data: Dict, indent: Optional[int] = None) -> str:
+    """
+    Serialize a log record dictionary to a JSON string.
+
+    Uses orjson when it is installed and can produce the requested layout
+    (compact or 2-space indent); otherwise, for data orjson rejects, and
+    for NaN or Infinity (which orjson writes as null), falls back to the
+    stdlib encoder.
+
+    Args:
+        data (Dict): Data to serialize.
+        indent (Optional[int]): Indentation level, None for compact output.
+
+    Returns:
+        str: JSON string.
+    """
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            encoded = orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. unsupported types or integers beyond 64 bits
+            pass
+        else:
+            # Only output containing null can have had NaN rewritten
+            if b"null" not in encoded or not _has_non_finite(data):
+                return encoded.decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, indent=indent)
+
 
 class LogColors:
     """
@@ -115,7 +178,46 @@ class LogColors:
             return LogColors.ANSI.RESET.value
 
 
-class ColorFormatter(logging.Formatter):
+# Color availability never changes at runtime, so resolve the codes once
+_LEVEL_COLORS = LogColors.get_level_colors()
+_RESET_CODE = LogColors.get_reset()
+
+
+class _TimeCacheMixin:
+    """
+    Caches the formatted time for records created in the same second.
+
+    Gives the same result as logging.Formatter.formatTime, but calls the
+    converter and strftime only once per second and date format.
+    """
+
+    # ((second, datefmt), formatted time), replaced as a whole so a thread
+    # never pairs one key with another key's text
+    _time_cache = (None, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Return the creation time of the record as formatted text.
+
+        Args:
+            record (logging.LogRecord): The log record.
+            datefmt (Optional[str]): Date format string; None for the default.
+
+        Returns:
+            str: Formatted time.
+        """
+        key = (int(record.created), datefmt)
+        cached_key, value = self._time_cache
+        if key != cached_key:
+            ct = self.converter(key[0])
+            value = time.strftime(datefmt or self.default_time_format, ct)
+            self._time_cache = (key, value)
+        if datefmt or not self.default_msec_format:
+            return value
+        return self.default_msec_format % (value, record.msecs)
+
+
+class ColorFormatter(_TimeCacheMixin, logging.Formatter):
     """
     Formats log records with colorized output based on the log level.
 
@@ -144,8 +246,14 @@ class ColorFormatter(logging.Formatter):
                 fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
         super().__init__(fmt=fmt, datefmt=datefmt, style=style)
-        self.level_colors = LogColors.get_level_colors()
-        self.reset_code = LogColors.get_reset()
+        self.level_colors = dict(_LEVEL_COLORS)
+        self.reset_code = _RESET_CODE
+        # Level name -> (prefix, suffix) around the formatted message
+        self._wrap = {
+            level: (color, self.reset_code)
+            for level, color in self.level_colors.items()
+        }
+        self._no_wrap = ('', self.reset_code)
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -157,15 +265,8 @@ class ColorFormatter(logging.Formatter):
         Returns:
             str: Colorized log message.
         """
-        # Format the message using the parent class
-        formatted_message = super().format(record)
-
-        # Apply color based on log level
-        level_name = record.levelname
-        color = self.level_colors.get(level_name, '')
-
-        # Return colorized message
-        return f"{color}{formatted_message}{self.reset_code}"
+        prefix, suffix = self._wrap.get(record.levelname, self._no_wrap)
+        return prefix + super().format(record) + suffix
 
 
 class JSONFormatter(logging.Formatter):
@@ -189,6 +290,36 @@ class JSONFormatter(logging.Formatter):
         super().__init__()
         self.include_extra_fields = include_extra_fields
         self.indent = indent
+        # (second, formatted 'YYYY-MM-DDTHH:MM:SS') of the last second seen;
+        # one attribute, so threads sharing the formatter never see a
+        # second paired with another second's text
+        self._last_prefix = (None, '')
+
+    def _timestamp(self, created: float) -> str:
+        """
+        Format a record time like datetime.fromtimestamp(created).isoformat().
+
+        The date and time part is formatted once per second; records in
+        the same second only append their microseconds.
+
+        Args:
+            created (float): Record creation time (seconds since the epoch).
+
+        Returns:
+            str: ISO 8601 local timestamp.
+        """
+        sec = int(created)
+        # Same rounding as datetime.fromtimestamp (half-even)
+        usec = round((created - sec) * 1e6)
+        if usec >= 1000000 or created < 0:
+            return datetime.fromtimestamp(created).isoformat()
+        cached_sec, prefix = self._last_prefix
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec).isoformat()
+            self._last_prefix = (sec, prefix)
+        if usec:
+            return f"{prefix}.{usec:06d}"
+        return prefix
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -202,7 +333,7 @@ class JSONFormatter(logging.Formatter):
         """
         # Create base dictionary with log information
         log_data = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'name': record.name,
             'message': record.getMessage(),
@@ -228,10 +359,14 @@ class JSONFormatter(logging.Formatter):
 
         # Add exception information if available
         if record.exc_info:
+            # Same cache the stdlib formatters use, so the traceback is
+            # rendered once however many handlers format this record
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
             log_data['exception'] = {
                 'type': record.exc_info[0].__name__,
                 'message': str(record.exc_info[1]),
-                'traceback': traceback.format_exception(*record.exc_info)
+                'traceback': record.exc_text
             }
 
         # Add custom data if available
@@ -239,10 +374,10 @@ class JSONFormatter(logging.Formatter):
             log_data['data'] = record.data
 
         # Convert to JSON
-        return json.dumps(log_data, ensure_ascii=False, indent=self.indent)
+        return _json_dumps(log_data, self.indent)
 
 
-class DetailedFormatter(logging.Formatter):
+class DetailedFormatter(_TimeCacheMixin, logging.Formatter):
     """
     Provides detailed log formatting with source code information.
 
@@ -299,7 +434,27 @@ class DetailedFormatter(logging.Formatter):
         return result
 
 
-class CompactFormatter(logging.Formatter):
+@lru_cache(maxsize=512)
+def _abbreviate_name(name: str) -> str:
+    """
+    Abbreviate a dotted logger name, keeping only its last part whole.
+
+    Names with fewer than three parts are returned unchanged. Logger names
+    form a small fixed set, so results are cached.
+
+    Args:
+        name (str): Logger name, e.g. 'data.json_file_manager.cache'.
+
+    Returns:
+        str: Abbreviated name, e.g. 'd.j.cache'.
+    """
+    name_parts = name.split('.')
+    if len(name_parts) <= 2:
+        return name
+    return '.'.join([part[0] for part in name_parts[:-1]] + [name_parts[-1]])
+
+
+class CompactFormatter(_TimeCacheMixin, logging.Formatter):
     """
     Formats log records in a compact single-line format.
 
@@ -333,20 +488,12 @@ class CompactFormatter(logging.Formatter):
         """
         # Abbreviate the logger name to save space
         original_name = record.name
-        name_parts = original_name.split('.')
-
-        if len(name_parts) > 2:
-            abbreviated_parts = [part[0] for part in name_parts[:-1]]
-            abbreviated_parts.append(name_parts[-1])
-            record.name = '.'.join(abbreviated_parts)
-
-        # Format the message
-        formatted_message = super().format(record)
-
-        # Restore the original name
-        record.name = original_name
-
-        return formatted_message
+        record.name = _abbreviate_name(original_name)
+        try:
+            return super().format(record)
+        finally:
+            # Restore the original name
+            record.name = original_name
 
 
 class HTMLFormatter(logging.Formatter):
@@ -376,6 +523,16 @@ class HTMLFormatter(logging.Formatter):
             'CRITICAL': 'color: #dc3545; font-weight: bold;',  # Bold red
         }
 
+        # One-pass HTML escaping and prebuilt level markup
+        self._html_table = str.maketrans(
+            {'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+        self._level_spans = {
+            level: f'<span style="{style}">{level}</span>'
+            for level, style in self.level_styles.items()
+        }
+        # (second, formatted timestamp) of the last record, read as one pair
+        self._last_timestamp = (None, '')
+
     def format_header(self) -> str:
         """
         Generate the HTML header with styles.
@@ -421,33 +578,38 @@ class HTMLFormatter(logging.Formatter):
         Returns:
             str: HTML-formatted log entry.
         """
-        # Get the log message
-        message = record.getMessage()
-
-        # Escape HTML special characters
-        message = message.replace("&", "&amp;").replace(
-            "<", "&lt;").replace(">", "&gt;")
-
-        # Format the timestamp
-        timestamp = datetime.fromtimestamp(
-            record.created).strftime('%Y-%m-%d %H:%M:%S')
-
-        # Get the style for this log level
-        level_style = self.level_styles.get(record.levelname, '')
+        # Get the log message, escaping HTML special characters
+        message = record.getMessage().translate(self._html_table)
+
+        # Format the timestamp, once per second
+        created = record.created
+        sec = int(created)
+        if round((created - sec) * 1e6) >= 1000000:
+            # fromtimestamp rounds this up into the next second
+            sec += 1
+        cached_sec, timestamp = self._last_timestamp
+        if sec != cached_sec:
+            timestamp = datetime.fromtimestamp(
+                sec).strftime('%Y-%m-%d %H:%M:%S')
+            self._last_timestamp = (sec, timestamp)
+
+        # Get the markup for this log level
+        level_span = self._level_spans.get(record.levelname)
+        if level_span is None:
+            level_span = f'<span style="">{record.levelname}</span>'
 
         # Format exception information if available
         exception_html = ""
         if record.exc_info:
-            exception_text = self.formatException(record.exc_info)
-            exception_text = exception_text.replace(
-                "&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            exception_text = self.formatException(
+                record.exc_info).translate(self._html_table)
             exception_html = f'<pre>{exception_text}</pre>'
 
         # Construct the HTML entry
         return f"""        <div class="log-entry">
             <span class="timestamp">[{timestamp}]</span>
             <span class="logger">{record.name}</span>:
-            <span style="{level_style}">{record.levelname}</span> -
+            {level_span} -
             <span class="message">{message}</span>
             {exception_html}
         </div>
@@ -462,6 +624,26 @@ class ConfigurableFormatter(logging.Formatter):
     records, as well as custom processing functions for fields.
     """
 
+    # Matches {field} and {field:processor} placeholders
+    _PLACEHOLDER = re.compile(r'\{(\w+)(?::(\w+))?\}')
+
+    # Fields read directly from the record
+    _RECORD_ATTRS = frozenset((
+        'name', 'levelname', 'levelno', 'pathname', 'filename', 'module',
+        'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+        'thread', 'threadName', 'process', 'processName',
+    ))
+
+    # Fields computed by the formatter: name -> function(formatter, record)
+    _COMPUTED_FIELDS = {
+        'asctime': lambda fmt, record: fmt.formatTime(record, fmt.datefmt),
+        'message': lambda fmt, record: record.getMessage(),
+        'exc_text': lambda fmt, record: (
+            fmt.formatException(record.exc_info) if record.exc_info else ""),
+        'stack_info': lambda fmt, record: (
+            fmt.formatStack(record.stack_info) if record.stack_info else ""),
+    }
+
     def __init__(self, template: str, processors: Optional[Dict[str, callable]] = None,
                  datefmt: Optional[str] = None):
         """
@@ -481,6 +663,32 @@ class ConfigurableFormatter(logging.Formatter):
         # Add some default processors
         self._add_default_processors()
 
+    @property
+    def template(self) -> str:
+        """str: The template string; setting it re-parses the template."""
+        return self._template
+
+    @template.setter
+    def template(self, template: str) -> None:
+        self._template = template
+
+        # Split the template once into (literal, field, processor, placeholder)
+        # segments; unknown fields are kept as literal text
+        segments = []
+        literal = ''
+        pos = 0
+        for match in self._PLACEHOLDER.finditer(template):
+            literal += template[pos:match.start()]
+            pos = match.end()
+            field, processor_name = match.groups()
+            if field not in self._RECORD_ATTRS and field not in self._COMPUTED_FIELDS:
+                literal += match.group(0)
+                continue
+            segments.append((literal, field, processor_name, match.group(0)))
+            literal = ''
+        self._segments = segments
+        self._trailing = literal + template[pos:]
+
     def _add_default_processors(self):
         """Add default processors to the processor dictionary."""
         default_processors = {
@@ -502,62 +710,35 @@ class ConfigurableFormatter(logging.Formatter):
         """
         Format the log record using the template.
 
+        Only the fields the template references are computed.
+
         Args:
             record (logging.LogRecord): The log record to format.
 
         Returns:
             str: Formatted log message according to the template.
         """
-        # Create a dictionary of all available record attributes
-        record_dict = {
-            'name': record.name,
-            'levelname': record.levelname,
-            'levelno': record.levelno,
-            'pathname': record.pathname,
-            'filename': record.filename,
-            'module': record.module,
-            'lineno': record.lineno,
-            'funcName': record.funcName,
-            'created': record.created,
-            'asctime': self.formatTime(record, self.datefmt),
-            'msecs': record.msecs,
-            'relativeCreated': record.relativeCreated,
-            'thread': record.thread,
-            'threadName': record.threadName,
-            'process': record.process,
-            'processName': record.processName,
-            'message': record.getMessage(),
-        }
-
-        # Add exception info if available
-        if record.exc_info:
-            record_dict['exc_text'] = self.formatException(record.exc_info)
-        else:
-            record_dict['exc_text'] = ""
-
-        # Add stack info if available
-        if record.stack_info:
-            record_dict['stack_info'] = self.formatStack(record.stack_info)
-        else:
-            record_dict['stack_info'] = ""
-
-        # Format the template using the record dictionary and processors
-        # This is a simplified implementation - a real one would use a proper template engine
-        result = self.template
-
-        # First replace simple fields without processors
-        for field, value in record_dict.items():
-            result = result.replace(f"{{{field}}}", str(value))
-
-        # Then handle fields with processors
-        processor_pattern = r'\{(\w+):(\w+)\}'
-        matches = re.findall(processor_pattern, result)
+        record_attrs = self._RECORD_ATTRS
+        computed = self._COMPUTED_FIELDS
+        processors = self.processors
+        values = {}
+        parts = []
+        for literal, field, processor_name, placeholder in self._segments:
+            parts.append(literal)
+            if field in record_attrs:
+                value = getattr(record, field)
+            elif field in values:
+                value = values[field]
+            else:
+                value = values[field] = computed[field](self, record)
 
-        for field, processor_name in matches:
-            if field in record_dict and processor_name in self.processors:
-                value = record_dict[field]
-                processed_value = self.processors[processor_name](value)
-                result = result.replace(
-                    f"{{{field}:{processor_name}}}", str(processed_value))
+            if processor_name is None:
+                parts.append(str(value))
+            elif processor_name in processors:
+                parts.append(str(processors[processor_name](value)))
+            else:
+                # Unknown processor: leave the placeholder as written
+                parts.append(placeholder)
+        parts.append(self._trailing)
 
-        return result
+        return ''.join(parts)
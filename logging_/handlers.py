@@ -25,6 +25,22 @@ import shutil
 import time
 import multiprocessing
 import socket
+import threading
+import json
+import base64
+import http.client
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows
+    fcntl = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
 class SafeRotatingFileHandler(logging.handlers.RotatingFileHandler):
@@ -60,31 +76,93 @@ class MultiProcessSafeTimedRotatingFileHandler(logging.handlers.TimedRotatingFil
     """
     TimedRotatingFileHandler that's safe for use in a multi-processing environment.
 
-    This handler uses a multiprocessing lock to ensure that only one process can
-    write to the log file at a time, preventing file corruption.
+    On POSIX, records are written without cross-process locking: the log is
+    opened in append mode, so each line is appended atomically. Only rollover
+    is coordinated, through an flock on a hidden lock file next to the log,
+    and a process that finds the log already rotated by another one just
+    reopens it. Where fcntl is unavailable, a multiprocessing lock guards
+    every write and rollover instead.
     """
 
     def __init__(self, filename, when='h', interval=1, backupCount=0, encoding=None,
                  delay=False, utc=False):
         super().__init__(filename, when, interval, backupCount, encoding, delay, utc)
         self._lock = multiprocessing.Lock()
+        log_dir, log_name = os.path.split(self.baseFilename)
+        self._rollover_lock_path = os.path.join(log_dir, f".{log_name}.lock")
 
     def doRollover(self):
         """
         Do a rollover, as described in TimedRotatingFileHandler.
 
-        This method is modified to acquire a multiprocessing lock before doing the rollover.
+        Only one process rotates the file; the others reopen the new log.
+        """
+        if fcntl is None:
+            with self._lock:
+                super().doRollover()
+            return
+
+        with open(self._rollover_lock_path, 'a', encoding='utf-8') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                if self._rotated_elsewhere():
+                    if self.stream:
+                        self.stream.close()
+                        self.stream = None
+                    if not self.delay:
+                        self.stream = self._open()
+                    self.rolloverAt = self.computeRollover(int(time.time()))
+                else:
+                    super().doRollover()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _rollover_target(self):
+        """
+        Return the backup name the current period rotates to.
+
+        Mirrors the name TimedRotatingFileHandler.doRollover derives from
+        rolloverAt.
         """
-        with self._lock:
-            super().doRollover()
+        t = self.rolloverAt - self.interval
+        if self.utc:
+            time_tuple = time.gmtime(t)
+        else:
+            time_tuple = time.localtime(t)
+            dst_now = time.localtime(int(time.time()))[-1]
+            if dst_now != time_tuple[-1]:
+                time_tuple = time.localtime(t + (3600 if dst_now else -3600))
+        return self.rotation_filename(
+            self.baseFilename + "." + time.strftime(self.suffix, time_tuple))
+
+    def _rotated_elsewhere(self):
+        """
+        Check whether another process already rotated the current period.
+
+        Does not depend on an open stream, so it also holds with delay=True
+        or after a failed open: the period's backup file already existing
+        means it was rotated, and stdlib rollover would delete that backup.
+        """
+        if os.path.exists(self._rollover_target()):
+            return True
+        if not self.stream:
+            return False
+        try:
+            current = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return True
+        return current.st_ino != os.fstat(self.stream.fileno()).st_ino
 
     def emit(self, record):
         """
         Emit a record.
 
-        This method is modified to acquire a multiprocessing lock before emitting the record.
+        Without fcntl, a multiprocessing lock is held while emitting.
         """
-        with self._lock:
+        if fcntl is None:
+            with self._lock:
+                super().emit(record)
+        else:
             super().emit(record)
 
 
@@ -93,9 +171,13 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
     Rotating file handler that compresses old log files using gzip.
 
     When a rollover occurs, the old log file is compressed with gzip and renamed
-    with a .gz extension.
+    with a .gz extension. Rotated logs are compressed at level 1 by default,
+    which is several times cheaper than gzip's default and costs little in
+    size on text logs; set compresslevel to trade speed for size.
     """
 
+    compresslevel = 1
+
     def doRollover(self):
         """
         Do a rollover, as described in RotatingFileHandler.
@@ -107,8 +189,9 @@ class CompressedRotatingFileHandler(logging.handlers.RotatingFileHandler):
         # Compress the old log file
         old_log = self.baseFilename + ".1"
         with open(old_log, 'rb') as f_in:
-            with gzip.open(old_log + '.gz', 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+            with gzip.open(old_log + '.gz', 'wb',
+                           compresslevel=self.compresslevel) as f_out:
+                shutil.copyfileobj(f_in, f_out, 1 << 20)
 
         # Remove the old uncompressed log file
         os.remove(old_log)
@@ -170,12 +253,19 @@ class BufferingHandler(logging.handlers.BufferingHandler):
     This handler accumulates log records in a buffer and flushes them to the
     underlying handler periodically based on the specified criteria (e.g., number
     of buffered records or time interval).
+
+    With collapse_duplicates (off by default), records in one flush that come
+    from the same logger and call site with the same level, message and
+    arguments are passed on once, at the position of the first, with a
+    " [xN]" count suffix. Records carrying exception info are never collapsed.
     """
 
-    def __init__(self, capacity=1000, interval=1.0, target=None):
+    def __init__(self, capacity=1000, interval=1.0, target=None,
+                 collapse_duplicates=False):
         super().__init__(capacity)
         self.target = target
         self.interval = interval
+        self.collapse_duplicates = collapse_duplicates
         self.last_flush_time = time.time()
 
     def shouldFlush(self, record):
@@ -202,24 +292,245 @@ class BufferingHandler(logging.handlers.BufferingHandler):
         self.acquire()
         try:
             if self.target:
-                for record in self.buffer:
+                records = (self._collapse(self.buffer) if self.collapse_duplicates
+                           else self.buffer)
+                for record in records:
                     self.target.handle(record)
                 self.buffer.clear()
         finally:
             self.release()
 
+    @staticmethod
+    def _collapse(records):
+        """
+        Merge repeated records, keeping the order of first occurrence.
+
+        Returns a list of records; merged ones are copies with the count
+        appended to their message, so the buffered records stay untouched.
+        """
+        counts = {}
+        ordered = []
+        for record in records:
+            key = None
+            if not record.exc_info:
+                args = record.args
+                key = (record.name, record.pathname, record.lineno,
+                       record.levelname, record.msg,
+                       tuple(args) if isinstance(args, (tuple, list)) else args)
+                try:
+                    hash(key)
+                except TypeError:
+                    # e.g. dict or list arguments
+                    key = None
+            if key is None:
+                ordered.append([record, 1])
+            elif key in counts:
+                counts[key][1] += 1
+            else:
+                counts[key] = entry = [record, 1]
+                ordered.append(entry)
+
+        result = []
+        for record, count in ordered:
+            if count > 1:
+                record = logging.makeLogRecord(record.__dict__)
+                record.msg = f"{record.msg} [x{count}]"
+            result.append(record)
+        return result
+
+
+class _FlushTimerMixin:
+    """
+    Flushes a batching handler flush_interval seconds after its first
+    buffered record, so the tail of a burst does not wait for more records.
+
+    One daemon thread per handler, started with the first deadline, waits
+    for the deadlines and lives until the handler is closed.
+    """
 
-class HTTPHandler(logging.handlers.HTTPHandler):
+    def _init_flush_timer(self):
+        """Set up the flush deadline; call from __init__."""
+        self._flush_cond = threading.Condition(threading.Lock())
+        # Monotonic time of the next flush, None while nothing is buffered
+        self._flush_deadline = None
+        self._flush_thread = None
+        self._flush_stopped = False
+
+    def _arm_flush_timer(self):
+        """Set a flush deadline unless one is already pending."""
+        with self._flush_cond:
+            if self._flush_deadline is not None or self._flush_stopped:
+                return
+            self._flush_deadline = time.monotonic() + self.flush_interval
+            if self._flush_thread is None:
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, name="log-flush", daemon=True)
+                self._flush_thread.start()
+            else:
+                self._flush_cond.notify()
+
+    def _cancel_flush_timer(self):
+        """Drop the pending deadline, if any; the caller is sending the batch."""
+        # A lone store; the flush thread rereads it before acting on it
+        self._flush_deadline = None
+
+    def _stop_flush_timer(self):
+        """Let the flush thread exit; the handler is closing."""
+        with self._flush_cond:
+            self._flush_stopped = True
+            self._flush_deadline = None
+            self._flush_cond.notify()
+
+    def _flush_loop(self):
+        """Wait for each flush deadline and flush the handler when it passes."""
+        cond = self._flush_cond
+        while True:
+            with cond:
+                while True:
+                    if self._flush_stopped:
+                        return
+                    deadline = self._flush_deadline
+                    if deadline is None:
+                        cond.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._flush_deadline = None
+                        break
+                    cond.wait(remaining)
+            # Outside the condition: flush() takes the handler lock, which
+            # emit() holds while arming
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                pass
+
+
+class HTTPHandler(_FlushTimerMixin, logging.handlers.HTTPHandler):
     """
     Handler that sends logs to a HTTP server.
 
     This handler sends log records as HTTP POST requests to a specified URL.
     It supports SSL encryption and basic authentication.
+
+    By default each record is sent on its own, url-encoded, as by the
+    standard handler. With POST and a batch_size above 1, records are
+    buffered and sent as one newline-delimited JSON request (Content-type
+    application/x-ndjson) once batch_size records are queued or
+    flush_interval seconds after the first of them, over a connection that
+    is kept open between batches.
     """
 
     def __init__(self, host, url, method="POST", secure=False, credentials=None,
-                 context=None):
+                 context=None, batch_size=1, flush_interval=1.0):
         super().__init__(host, url, method, secure, credentials, context)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._init_flush_timer()
+        self._buffer = []
+        self._last_record = None
+        self._connection = None
+
+    def emit(self, record):
+        """
+        Queue the record for the next batch, sending the batch when it is due.
+        """
+        if self.batch_size <= 1 or self.method != "POST":
+            super().emit(record)
+            return
+
+        try:
+            self._buffer.append(self.mapLogRecord(record))
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+        self._last_record = record
+
+        if len(self._buffer) >= self.batch_size:
+            self._send_batch()
+        else:
+            self._arm_flush_timer()
+
+    def flush(self):
+        """
+        Send any buffered records now.
+        """
+        self.acquire()
+        try:
+            if self._buffer:
+                self._send_batch()
+        finally:
+            self.release()
+
+    def close(self):
+        """
+        Send any buffered records and close the connection.
+        """
+        try:
+            self.flush()
+        finally:
+            self._stop_flush_timer()
+            self.acquire()
+            try:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+            finally:
+                self.release()
+            super().close()
+
+    def _send_batch(self):
+        """
+        POST the buffered records as one NDJSON request.
+        """
+        self._cancel_flush_timer()
+        batch, self._buffer = self._buffer, []
+        record, self._last_record = self._last_record, None
+
+        try:
+            if ORJSON_AVAILABLE:
+                body = b''.join(orjson.dumps(item) + b'\n' for item in batch)
+            else:
+                body = ''.join(
+                    json.dumps(item, ensure_ascii=False) + '\n' for item in batch
+                ).encode('utf-8')
+
+            headers = {"Content-type": "application/x-ndjson"}
+            if self.credentials:
+                token = ('%s:%s' % self.credentials).encode('utf-8')
+                headers['Authorization'] = (
+                    'Basic ' + base64.b64encode(token).strip().decode('ascii'))
+
+            self._post(body, headers)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def _post(self, body, headers):
+        """
+        Send one request on the kept-alive connection, reopening it if needed.
+
+        If sending the request fails on a reused connection, which the
+        server may have closed, it is sent once more on a fresh one. Errors
+        after the request was sent are not retried: the server may already
+        have accepted the batch.
+        """
+        reused = self._connection is not None
+        if not reused:
+            self._connection = self.getConnection(self.host, self.secure)
+        try:
+            try:
+                self._connection.request("POST", self.url, body=body, headers=headers)
+            except (http.client.HTTPException, OSError):
+                if not reused:
+                    raise
+                self._connection.close()
+                self._connection = self.getConnection(self.host, self.secure)
+                self._connection.request("POST", self.url, body=body, headers=headers)
+            self._connection.getresponse().read()
+        except Exception:
+            self._connection.close()
+            self._connection = None
+            raise
 
     def mapLogRecord(self, record):
         """
@@ -238,34 +549,96 @@ class HTTPHandler(logging.handlers.HTTPHandler):
         }
 
 
-class SocketHandler(logging.handlers.SocketHandler):
+class SocketHandler(_FlushTimerMixin, logging.handlers.SocketHandler):
     """
     Handler that sends logs over a socket connection.
 
-    This handler sends pickled LogRecord objects to a network socket. It supports
-    sending logs over TCP or UDP to a specified host and port.
+    This handler sends pickled LogRecord objects to a network socket over a
+    persistent TCP connection (TCP_NODELAY, SO_KEEPALIVE), or to a Unix
+    domain socket at host when port is None.
+
+    A record arriving on an idle connection is sent at once. During bursts,
+    pickled records are coalesced and written with one sendall once
+    batch_size records are pending, or by a timer flush_interval seconds
+    after the first of them; flush() and close() send whatever is left.
+
+    If a send fails, the batch is retried once on a new connection; if that
+    fails too, the whole batch (up to batch_size records) is dropped, as the
+    standard handler drops a single record.
     """
 
-    def __init__(self, host, port):
-        # pylint: disable=useless-super-delegation
+    def __init__(self, host, port, batch_size=32, flush_interval=0.005):
         super().__init__(host, port)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._init_flush_timer()
+        self._pending = []
+        self._last_send_time = 0.0
 
     def makeSocket(self, timeout=1):
         """
         Create a socket that can be used for logging.
 
-        Overridden to specify the socket type based on the port number. If the
-        port is None, a UDP socket will be created. Otherwise, a TCP socket will
-        be created.
+        Overridden to tune TCP connections for a long-lived stream of small
+        writes: Nagle's algorithm is disabled, since records are already
+        coalesced here, and keep-alive detects dead peers.
         """
         if self.port is None:
-            family = socket.AF_INET
-            type_ = socket.SOCK_DGRAM  # UDP
-        else:
-            family = socket.AF_INET
-            type_ = socket.SOCK_STREAM  # TCP
+            return super().makeSocket(timeout)
+
+        sock = socket.create_connection(self.address, timeout=timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return sock
 
-        return socket.socket(family, type_)
+    def emit(self, record):
+        """
+        Pickle the record and send it, coalescing records during bursts.
+        """
+        try:
+            self._pending.append(self.makePickle(record))
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_send_time >= self.flush_interval):
+                self._send_pending()
+            else:
+                self._arm_flush_timer()
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+
+    def flush(self):
+        """
+        Send any records still pending.
+        """
+        self.acquire()
+        try:
+            if self._pending:
+                self._send_pending()
+        finally:
+            self.release()
+
+    def close(self):
+        """
+        Send pending records, then close the socket.
+        """
+        try:
+            self.flush()
+        finally:
+            self._stop_flush_timer()
+            super().close()
+
+    def _send_pending(self):
+        """
+        Write all pending records with a single sendall.
+        """
+        self._cancel_flush_timer()
+        data = b''.join(self._pending)
+        self._pending.clear()
+        self._last_send_time = time.monotonic()
+        self.send(data)
+        if self.sock is None:
+            # send() drops the socket when sendall fails; retry the batch
+            # once on a fresh connection
+            self.send(data)
 
 
 class SysLogHandler(logging.handlers.SysLogHandler):
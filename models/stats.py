@@ -1037,27 +1037,31 @@ class MetricsCollector:
             # Load account stats
             account_dir = os.path.join(self.stats_dir, "accounts")
             if os.path.exists(account_dir):
-                for account_file in os.listdir(account_dir):
-                    if account_file.endswith(".json"):
-                        # Remove .json extension
-                        account_id = account_file[:-5]
-                        account_data = self.file_manager.read_json(
-                            os.path.join(account_dir, account_file), default={}
-                        )
-                        self.account_stats[account_id] = AccountStats.from_dict(
-                            account_data)
+                with os.scandir(account_dir) as it:
+                    account_files = [
+                        e for e in it if e.name.endswith(".json") and e.is_file()]
+                for entry in account_files:
+                    # Remove .json extension
+                    account_id = entry.name[:-5]
+                    account_data = self.file_manager.read_json(
+                        entry.path, default={}
+                    )
+                    self.account_stats[account_id] = AccountStats.from_dict(
+                        account_data)
 
             # Load time series data
             ts_dir = os.path.join(self.stats_dir, "time_series")
             if os.path.exists(ts_dir):
-                for ts_file in os.listdir(ts_dir):
-                    if ts_file.endswith(".json"):
-                        ts_name = ts_file[:-5]  # Remove .json extension
-                        ts_data = self.file_manager.read_json(
-                            os.path.join(ts_dir, ts_file), default={}
-                        )
-                        self.time_series[ts_name] = TimeSeriesData.from_dict(
-                            ts_data)
+                with os.scandir(ts_dir) as it:
+                    ts_files = [
+                        e for e in it if e.name.endswith(".json") and e.is_file()]
+                for entry in ts_files:
+                    ts_name = entry.name[:-5]  # Remove .json extension
+                    ts_data = self.file_manager.read_json(
+                        entry.path, default={}
+                    )
+                    self.time_series[ts_name] = TimeSeriesData.from_dict(
+                        ts_data)
 
             logger.info("Metrics loaded from disk")
         except (IOError, FileNotFoundError) as e:
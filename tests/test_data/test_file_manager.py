@@ -1,5 +1,7 @@
 """
-Tests for the FileManager module (data/file_manager.py).
+Tests for the file manager modules (data/base_file_manager.py,
+data/json_file_manager.py, data/encrypted_file_manager.py and
+data/file_factory.py).
 
 This module contains unit tests for the FileManager class and its subclasses
 (JsonFileManager, EncryptedFileManager) which manage file operations.
@@ -7,6 +9,7 @@ This module contains unit tests for the FileManager class and its subclasses
 
 import os
 import json
+import math
 import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
@@ -15,16 +18,17 @@ import logging
 import time
 import shutil
 from pathlib import Path
+from datetime import datetime
 import threading
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 # Import the module and exceptions
-from data.file_manager import (
-    FileManager, JsonFileManager, EncryptedFileManager,
-    SafeFileWriter, get_file_manager
-)
+from data.base_file_manager import FileManager, SafeFileWriter
+from data.json_file_manager import JsonFileManager
+from data.encrypted_file_manager import EncryptedFileManager
+from data.file_factory import get_file_manager
 from core.exceptions import (
     FileReadError, FileWriteError, FileFormatError,
     EncryptionError, DecryptionError
@@ -101,6 +105,38 @@ class TestFileManager(unittest.TestCase):
         # Test with directory
         self.assertTrue(self.file_manager.exists(self.test_dir_path))
 
+    def test_missing_path_cache_is_bounded(self):
+        """Test that remembered missing paths are capped, oldest first."""
+        self.file_manager.NEGATIVE_CACHE_SIZE = 3
+        for i in range(5):
+            self.assertFalse(self.file_manager.exists(f"missing_{i}.txt"))
+
+        remembered = [Path(key).name for key in self.file_manager._negative_cache]
+        self.assertEqual(remembered, ["missing_2.txt", "missing_3.txt", "missing_4.txt"])
+
+    def test_missing_path_cache_concurrent_clear(self):
+        """Test that clearing the missing-path cache during probes is safe."""
+        self.file_manager.NEGATIVE_CACHE_SIZE = 8
+        errors = []
+
+        def probe(offset):
+            try:
+                for i in range(2000):
+                    self.file_manager.exists(f"missing_{offset}_{i}.txt")
+            except Exception as e:  # pylint: disable=broad-except
+                errors.append(e)
+
+        threads = [threading.Thread(target=probe, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            self.file_manager._paths_changed()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.file_manager._negative_cache), 8)
+
     def test_is_file(self):
         """Test file type check."""
         # Test with file
@@ -392,7 +428,18 @@ class TestFileManager(unittest.TestCase):
         self.assertTrue(info['is_file'])
         self.assertFalse(info['is_dir'])
         self.assertEqual(info['extension'], '.txt')
+        self.assertIsNone(info['hash'])
+
+        # Hashing is opt-in
+        info = self.file_manager.get_file_info(self.test_file, include_hash=True)
         self.assertIsNotNone(info['hash'])
+        self.assertIsNone(info['hash_skipped'])
+
+        # Files over the size limit are not hashed
+        info = self.file_manager.get_file_info(
+            self.test_file, include_hash=True, hash_size_limit=1)
+        self.assertIsNone(info['hash'])
+        self.assertEqual(info['hash_skipped'], 'too_large')
 
         # Test with a directory
         info = self.file_manager.get_file_info(self.test_dir_path)
@@ -434,6 +481,21 @@ class TestFileManager(unittest.TestCase):
         with self.assertRaises(FileReadError):
             self.file_manager.calculate_file_hash(self.test_dir_path)
 
+    def test_hash_many(self):
+        """Test hashing several files concurrently."""
+        hashes = self.file_manager.hash_many(
+            [self.test_file, "test_binary.bin"])
+        self.assertEqual(
+            hashes[self.test_file],
+            self.file_manager.calculate_file_hash(self.test_file))
+        self.assertEqual(
+            hashes[self.test_binary_file],
+            self.file_manager.calculate_file_hash(self.test_binary_file))
+
+        # Test with a missing file
+        with self.assertRaises(FileReadError):
+            self.file_manager.hash_many([self.test_file, self.non_existent_file])
+
     def test_get_temp_file(self):
         """Test creating a temporary file."""
         # Test basic temp file creation
@@ -561,6 +623,56 @@ class TestJsonFileManager(unittest.TestCase):
         data = self.json_manager.read_json(self.non_existent_json, default=default_data)
         self.assertEqual(data, default_data)
 
+    def test_read_json_stdlib_values(self):
+        """Test reading values the stdlib json encoder writes."""
+        stdlib_file = self.test_dir / "stdlib.json"
+        with open(stdlib_file, 'w') as f:
+            json.dump({"nan": float("nan"), "inf": float("inf"), "big": 2 ** 70}, f)
+
+        data = self.json_manager.read_json(stdlib_file)
+        self.assertTrue(math.isnan(data["nan"]))
+        self.assertEqual(data["inf"], float("inf"))
+        self.assertEqual(data["big"], 2 ** 70)
+        self.assertIsInstance(data["big"], int)
+
+    def test_write_json_same_types_for_any_indent(self):
+        """Test that accepted types don't depend on the indent or encoder."""
+        for indent in (None, 2, 4):
+            manager = JsonFileManager(base_dir=self.test_dir, indent=indent)
+            path = self.test_dir / f"types_{indent}.json"
+
+            # Values the stdlib encoder writes are written and read back
+            manager.write_json(path, {"big": 2 ** 70, 1: "int key"})
+            self.assertEqual(manager.read_json(path), {"big": 2 ** 70, "1": "int key"})
+
+            # Values it rejects are rejected
+            with self.assertRaises(TypeError):
+                manager.write_json(path, {"when": datetime(2024, 1, 1)})
+
+    def test_write_json_non_finite_round_trip(self):
+        """Test that NaN and Infinity read back the same with or without orjson."""
+        from data.encryption import Encryptor
+        enc_manager = EncryptedFileManager(
+            Encryptor(password="pw", salt=b"0123456789abcdef"), base_dir=self.test_dir)
+        data = {"nan": math.nan, "inf": math.inf, "nested": [-math.inf, None]}
+
+        for has_orjson in (True, False):
+            with patch('data.json_file_manager._HAS_ORJSON', has_orjson):
+                for indent in (None, 2, 4):
+                    manager = JsonFileManager(base_dir=self.test_dir, indent=indent)
+                    path = self.test_dir / f"non_finite_{has_orjson}_{indent}.json"
+                    manager.write_json(path, data)
+                    loaded = manager.read_json(path)
+                    self.assertTrue(math.isnan(loaded["nan"]))
+                    self.assertEqual(loaded["inf"], math.inf)
+                    self.assertEqual(loaded["nested"], [-math.inf, None])
+
+                path = self.test_dir / f"non_finite_{has_orjson}.enc"
+                enc_manager.write_encrypted_json(path, data)
+                loaded = enc_manager.read_encrypted_json(path)
+                self.assertTrue(math.isnan(loaded["nan"]))
+                self.assertEqual(loaded["nested"], [-math.inf, None])
+
     def test_write_json(self):
         """Test writing a JSON file."""
         # Test writing to a new file
@@ -647,6 +759,20 @@ class TestJsonFileManager(unittest.TestCase):
         with self.assertRaises(FileReadError):
             self.json_manager.merge_json(target_file, self.non_existent_json)
 
+        # Modifying the result must not leak into later merges
+        nested_source = self.test_dir / "nested_source.json"
+        with open(nested_source, 'w') as f:
+            json.dump({"nested": {"a": 1}}, f)
+        merged_data = self.json_manager.merge_json(target_file, nested_source)
+        merged_data["nested"]["a"] = 2
+        merged_data = self.json_manager.merge_json(target_file, source_file)
+        self.assertEqual(merged_data["nested"], {"a": 1})
+
+        # The cache holds its own parse of the written file, not the result
+        cached = self.json_manager.read_json(target_file, cached=True)
+        self.assertEqual(cached, merged_data)
+        self.assertIsNot(cached, merged_data)
+
     @unittest.skipIf(True, "jsonschema package required for this test")
     def test_validate_json(self):
         """Test validating a JSON file against a schema."""
@@ -728,6 +854,8 @@ class TestEncryptedFileManager(unittest.TestCase):
         self.mock_encryptor = MagicMock()
         self.mock_encryptor.encrypt.side_effect = lambda text: f"ENCRYPTED:{text}"
         self.mock_encryptor.decrypt.side_effect = lambda text: text.replace("ENCRYPTED:", "")
+        self.mock_encryptor.encrypt_bytes.side_effect = lambda data: b"ENCRYPTED:" + data
+        self.mock_encryptor.decrypt_bytes.side_effect = lambda data: data.replace(b"ENCRYPTED:", b"")
 
         # Create an EncryptedFileManager instance
         self.enc_manager = EncryptedFileManager(self.mock_encryptor, base_dir=self.test_dir)
@@ -837,10 +965,10 @@ class TestEncryptedFileManager(unittest.TestCase):
         json_data = {"key1": "value1", "key2": 42, "key3": [1, 2, 3]}
         self.enc_manager.write_encrypted_json(new_file, json_data)
 
-        # The encrypt method should be called with a JSON string
-        call_args = self.mock_encryptor.encrypt.call_args[0][0]
-        self.assertIn('"key1": "value1"', call_args)
-        self.assertIn('"key2": 42', call_args)
+        # The encrypt method should be called with the JSON bytes
+        call_args = self.mock_encryptor.encrypt_bytes.call_args[0][0]
+        self.assertIsInstance(call_args, bytes)
+        self.assertEqual(json.loads(call_args), json_data)
 
         # Test with non-serializable data
         with self.assertRaises(TypeError):
@@ -966,6 +1094,35 @@ class TestSafeFileWriter(unittest.TestCase):
 
         self.assertIn(file_content, contents)
 
+    def test_safe_write_batched(self):
+        """Test that batched writes coalesce and are flushed."""
+        SafeFileWriter.safe_write_batched(self.test_file, "First", max_delay_ms=10000)
+        SafeFileWriter.safe_write_batched(self.test_file, "Second", max_delay_ms=10000)
+
+        # Still pending until flushed
+        with open(self.test_file, 'r') as f:
+            self.assertEqual(f.read(), "Original content")
+        SafeFileWriter.flush_pending(self.test_file)
+
+        with open(self.test_file, 'r') as f:
+            self.assertEqual(f.read(), "Second")
+
+        # Content over the threshold is written immediately
+        SafeFileWriter.safe_write_batched(self.test_file, "Large", flush_threshold=1)
+        with open(self.test_file, 'r') as f:
+            self.assertEqual(f.read(), "Large")
+
+        # The threshold counts encoded bytes, not characters
+        SafeFileWriter.safe_write_batched(self.test_file, "\u00e9" * 3, flush_threshold=6)
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "\u00e9" * 3)
+
+        # Small writes are flushed in the background
+        SafeFileWriter.safe_write_batched(self.test_file, "Later", max_delay_ms=10)
+        time.sleep(0.3)
+        with open(self.test_file, 'r') as f:
+            self.assertEqual(f.read(), "Later")
+
 
 class TestGetFileManager(unittest.TestCase):
     """Test suite for the get_file_manager function."""
@@ -6,8 +6,10 @@ This module contains unit tests for the fallback mechanisms that handle error re
 
 import os
 import sys
+import tempfile
 import unittest
 import time
+import asyncio
 import threading
 from unittest.mock import patch, MagicMock, call
 from pathlib import Path
@@ -23,7 +25,8 @@ from error_handling.fallback import (
     retry_operation, with_recovery, RetryContext,
     OperationCheckpoint, switch_account_fallback,
     emergency_shutdown, get_fallback_manager,
-    retry_with_fallback_strategies
+    retry_with_fallback_strategies, retry_operation_async,
+    AsyncRetryContext, SQLiteRecoveryStore
 )
 
 from core.exceptions import (
@@ -123,6 +126,77 @@ class TestFallbackManager(unittest.TestCase):
         delay = self.manager.calculate_delay(self.operation_id)
         self.assertLessEqual(delay, self.manager.max_delay)
 
+    def test_jitter_modes(self):
+        """Test the alternative jitter modes stay within their bounds."""
+        full = FallbackManager(base_delay=1.0, max_delay=10.0, jitter_mode="full")
+        full.increment_retry_count(self.operation_id)  # count = 1
+        self.assertLessEqual(full.calculate_delay(self.operation_id), 2.0)
+
+        equal = FallbackManager(base_delay=1.0, max_delay=10.0, jitter_mode="equal")
+        equal.increment_retry_count(self.operation_id)
+        delay = equal.calculate_delay(self.operation_id)
+        self.assertGreaterEqual(delay, 1.0)
+        self.assertLessEqual(delay, 2.0)
+
+        decorrelated = FallbackManager(base_delay=1.0, max_delay=10.0,
+                                       jitter_mode="decorrelated")
+        prev = 1.0
+        for _ in range(5):
+            delay = decorrelated.calculate_delay(self.operation_id)
+            self.assertGreaterEqual(delay, 1.0)
+            self.assertLessEqual(delay, min(prev * 3, 10.0))
+            prev = delay
+
+        with self.assertRaises(ValueError):
+            FallbackManager(jitter_mode="unknown")
+
+    def test_retry_token_budget(self):
+        """Test that the retry budget drains on retries and refills on success."""
+        budget = int(FallbackManager.RETRY_TOKEN_CAP // FallbackManager.RETRY_TOKEN_COST)
+        for _ in range(budget):
+            self.assertTrue(self.manager.try_acquire_retry_token())
+        self.assertFalse(self.manager.try_acquire_retry_token())
+
+        for _ in range(int(FallbackManager.RETRY_TOKEN_COST)):
+            self.manager.refund_retry_token()
+        self.assertTrue(self.manager.try_acquire_retry_token())
+
+    def test_record_failure(self):
+        """Test that record_failure counts the attempt and picks a strategy."""
+        retry_count, strategy, delay = self.manager.record_failure(
+            self.operation_id, FloodWaitError(seconds=5))
+        self.assertEqual(retry_count, 1)
+        self.assertEqual(strategy, FallbackStrategy.WAIT_AND_RETRY)
+        self.assertEqual(delay, 5)
+        self.assertEqual(self.manager.get_retry_count(self.operation_id), 1)
+
+        retry_count, strategy, _ = self.manager.record_failure(
+            self.operation_id, ValueError("boom"))
+        self.assertEqual(retry_count, 2)
+        self.assertEqual(strategy, FallbackStrategy.ABORT)
+
+    def test_concurrent_retry_counts(self):
+        """Test that concurrent failures on one operation are all counted."""
+        threads_count, per_thread = 8, 500
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            def fail_many():
+                for _ in range(per_thread):
+                    self.manager.record_failure(self.operation_id, ValueError("boom"))
+                    self.manager.increment_retry_count(self.operation_id)
+
+            threads = [threading.Thread(target=fail_many) for _ in range(threads_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(self.manager.get_retry_count(self.operation_id),
+                         2 * threads_count * per_thread)
+
     def test_recovery_point_management(self):
         """Test recovery point management."""
         # Save a recovery point
@@ -140,11 +214,38 @@ class TestFallbackManager(unittest.TestCase):
         self.manager.mark_recovery_complete(self.operation_id, True)
         recovery_info = self.manager.recovery_data.get(self.operation_id)
         self.assertEqual(recovery_info["state"], RecoveryState.RECOVERED)
+        self.assertAlmostEqual(recovery_info["timestamp"], time.time(), delta=60)
 
         # Clear the recovery point
         self.manager.clear_recovery_point(self.operation_id)
         self.assertFalse(self.manager.has_recovery_point(self.operation_id))
 
+    def test_persistent_recovery_store(self):
+        """Test that recovery points in an SQLite store survive a new manager."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "recovery.db")
+            test_data = {"position": 42, "data": "test"}
+
+            manager = FallbackManager(store=SQLiteRecoveryStore(path))
+            manager.save_recovery_point(self.operation_id, test_data)
+            manager.mark_recovery_complete(self.operation_id, success=False)
+            saved = manager.recovery_data[self.operation_id]
+
+            # A new manager on the same file sees the saved state
+            restarted = FallbackManager(store=SQLiteRecoveryStore(path))
+            self.assertTrue(restarted.has_recovery_point(self.operation_id))
+            self.assertEqual(restarted.get_recovery_point(self.operation_id), test_data)
+            loaded = restarted.recovery_data[self.operation_id]
+            self.assertEqual(loaded["state"], RecoveryState.FAILED)
+            # Wall-clock nanoseconds round-trip exactly
+            self.assertEqual(loaded["timestamp_ns"], saved["timestamp_ns"])
+            self.assertEqual(loaded["timestamp"], saved["timestamp"])
+
+            restarted.clear_recovery_point(self.operation_id)
+            self.assertFalse(
+                FallbackManager(store=SQLiteRecoveryStore(path))
+                .has_recovery_point(self.operation_id))
+
     def test_get_fallback_strategy(self):
         """Test fallback strategy selection based on exception type."""
         # Test FloodWaitError
@@ -209,6 +310,7 @@ class TestRetryOperation(unittest.TestCase):
         self.operation_id = "test_retry_operation"
         # Create a mock fallback manager
         self.fallback_manager = MagicMock(spec=FallbackManager)
+        self.fallback_manager.max_retries = 3
         self.fallback_manager.can_retry.return_value = True
         self.fallback_manager.get_retry_count.return_value = 0
         self.fallback_manager.calculate_delay.return_value = 0.01  # Small delay for tests
@@ -225,7 +327,8 @@ class TestRetryOperation(unittest.TestCase):
 
         # Call retry_operation
         result = retry_operation(
-            mock_func, self.operation_id, self.fallback_manager,
+            mock_func, self.operation_id,
+            fallback_manager=self.fallback_manager,
             max_retries=3, base_delay=0.01
         )
 
@@ -240,12 +343,12 @@ class TestRetryOperation(unittest.TestCase):
         mock_func = MagicMock(side_effect=[ValueError("First call fails"), "success"])
 
         # Mock fallback manager behavior
-        self.fallback_manager.get_fallback_strategy.return_value = FallbackStrategy.RETRY
-        self.fallback_manager.increment_retry_count.return_value = 1
+        self.fallback_manager.record_failure.return_value = (1, FallbackStrategy.RETRY, 0.01)
 
         # Call retry_operation
         result = retry_operation(
-            mock_func, self.operation_id, self.fallback_manager,
+            mock_func, self.operation_id,
+            fallback_manager=self.fallback_manager,
             max_retries=3, base_delay=0.01
         )
 
@@ -253,7 +356,7 @@ class TestRetryOperation(unittest.TestCase):
         self.assertEqual(mock_func.call_count, 2)
         self.assertEqual(result, "success")
         self.fallback_manager.reset_retry_count.assert_called_with(self.operation_id)
-        self.fallback_manager.get_fallback_strategy.assert_called_once()
+        self.fallback_manager.record_failure.assert_called_once()
 
     def test_max_retries_reached(self):
         """Test retry_operation when max retries is reached."""
@@ -262,15 +365,13 @@ class TestRetryOperation(unittest.TestCase):
         mock_func = MagicMock(side_effect=error)
 
         # Mock fallback manager behavior
-        self.fallback_manager.get_fallback_strategy.return_value = FallbackStrategy.RETRY
-
-        # Set up increment_retry_count to increment a counter properly
+        # Set up record_failure to increment a counter properly
         retry_count = 0
-        def increment_mock(*args, **kwargs):
+        def record_failure_mock(*args, **kwargs):
             nonlocal retry_count
             retry_count += 1
-            return retry_count
-        self.fallback_manager.increment_retry_count.side_effect = increment_mock
+            return retry_count, FallbackStrategy.RETRY, 0.01
+        self.fallback_manager.record_failure.side_effect = record_failure_mock
 
         # Set up can_retry to return False after a few tries
         def can_retry_mock(*args, **kwargs):
@@ -280,7 +381,8 @@ class TestRetryOperation(unittest.TestCase):
         # Call retry_operation and expect it to eventually raise the error
         with self.assertRaises(ValueError) as context:
             retry_operation(
-                mock_func, self.operation_id, self.fallback_manager,
+                mock_func, self.operation_id,
+                fallback_manager=self.fallback_manager,
                 max_retries=3, base_delay=0.01
             )
 
@@ -298,49 +400,82 @@ class TestRetryOperation(unittest.TestCase):
         error_callback = MagicMock()
 
         # Mock fallback manager behavior
-        self.fallback_manager.get_fallback_strategy.return_value = FallbackStrategy.RETRY
-
-        # Set up increment_retry_count to increment a counter properly
+        # Set up record_failure to increment a counter properly
         retry_count = 0
-        def increment_mock(*args, **kwargs):
+        def record_failure_mock(*args, **kwargs):
             nonlocal retry_count
             retry_count += 1
-            return retry_count
-        self.fallback_manager.increment_retry_count.side_effect = increment_mock
+            return retry_count, FallbackStrategy.RETRY, 0.01
+        self.fallback_manager.record_failure.side_effect = record_failure_mock
 
-        # Set up can_retry to return False after one try
-        def can_retry_mock(*args, **kwargs):
-            return retry_count < 1
-        self.fallback_manager.can_retry.side_effect = can_retry_mock
+        # The loop stops once record_failure reports max_retries attempts
+        self.fallback_manager.max_retries = 1
 
         # Call retry_operation and expect it to eventually raise the error
         with self.assertRaises(ValueError):
             retry_operation(
-                mock_func, self.operation_id, self.fallback_manager,
+                mock_func, self.operation_id,
+                fallback_manager=self.fallback_manager,
                 max_retries=3, base_delay=0.01, error_callback=error_callback
             )
 
         # Check that error callback was called
         error_callback.assert_called_once_with(error, 1)  # Called with error and retry count
 
+    def test_retry_budget_exhausted(self):
+        """Test retry_operation fails fast once the retry budget is spent."""
+        mock_func = MagicMock(side_effect=ValueError("Test error"))
+        self.fallback_manager.record_failure.return_value = (1, FallbackStrategy.RETRY, 0.01)
+        self.fallback_manager.try_acquire_retry_token.return_value = False
+
+        with self.assertRaises(OperationError):
+            retry_operation(
+                mock_func, self.operation_id,
+                fallback_manager=self.fallback_manager
+            )
+
+        self.assertEqual(mock_func.call_count, 1)
+
+    def test_default_manager_shares_budget(self):
+        """Test that retry_operation spends the shared budget by default."""
+        mock_func = MagicMock(side_effect=[ValueError("Test error"), "success"])
+        budget = MagicMock(spec=FallbackManager)
+        budget.try_acquire_retry_token.return_value = True
+
+        with patch('error_handling.fallback.FallbackManager') as MockManager, \
+             patch('error_handling.fallback.get_fallback_manager', return_value=budget):
+            # The per-call manager keeps the count and backoff
+            MockManager.return_value.max_retries = 3
+            MockManager.return_value.record_failure.return_value = (
+                1, FallbackStrategy.RETRY, 0.001)
+            result = retry_operation(
+                mock_func, self.operation_id, max_retries=3, base_delay=0.001)
+
+        MockManager.assert_called_once_with(max_retries=3, base_delay=0.001)
+
+        self.assertEqual(result, "success")
+        budget.try_acquire_retry_token.assert_called_once_with()
+        budget.refund_retry_token.assert_called_once_with()
+
     def test_abort_strategy(self):
         """Test retry_operation with ABORT strategy."""
         # Mock function that fails
         mock_func = MagicMock(side_effect=ValueError("Test error"))
 
         # Mock fallback manager to return ABORT strategy
-        self.fallback_manager.get_fallback_strategy.return_value = FallbackStrategy.ABORT
+        self.fallback_manager.record_failure.return_value = (1, FallbackStrategy.ABORT, 0.01)
 
         # Call retry_operation and expect it to abort immediately
         with self.assertRaises(ValueError):
             retry_operation(
-                mock_func, self.operation_id, self.fallback_manager,
+                mock_func, self.operation_id,
+                fallback_manager=self.fallback_manager,
                 max_retries=3, base_delay=0.01
             )
 
         # Check that function was called only once (no retries)
         self.assertEqual(mock_func.call_count, 1)
-        self.fallback_manager.get_fallback_strategy.assert_called_once()
+        self.fallback_manager.record_failure.assert_called_once()
 
 
 class TestWithRecovery(unittest.TestCase):
@@ -390,8 +525,9 @@ class TestWithRecovery(unittest.TestCase):
         # Call with_recovery
         result = with_recovery(
             self.mock_func, self.operation_id,
-            self.mock_state_getter, self.fallback_manager,
-            arg1="value1"
+            self.mock_state_getter,
+            fallback_manager=self.fallback_manager,
+            capture_after=0, arg1="value1"
         )
 
         # Check function calls
@@ -410,6 +546,53 @@ class TestWithRecovery(unittest.TestCase):
         # Check result
         self.assertEqual(result, "success")
 
+    def test_fast_success_skips_state_capture(self):
+        """Test that a quick success never captures the running state."""
+        self.fallback_manager.has_recovery_point.return_value = False
+
+        result = with_recovery(
+            self.mock_func, self.operation_id, self.mock_state_getter,
+            fallback_manager=self.fallback_manager, arg1="value1"
+        )
+
+        self.assertEqual(result, "success")
+        self.mock_state_getter.assert_not_called()
+        self.fallback_manager.save_recovery_point.assert_not_called()
+        self.fallback_manager.clear_recovery_point.assert_called_once_with(
+            self.operation_id
+        )
+
+    def test_default_manager_is_shared(self):
+        """Test that with_recovery uses the shared manager by default."""
+        self.fallback_manager.has_recovery_point.return_value = False
+
+        with patch('error_handling.fallback.get_fallback_manager',
+                   return_value=self.fallback_manager):
+            result = with_recovery(
+                self.mock_func, self.operation_id, self.mock_state_getter)
+
+        self.assertEqual(result, "success")
+        self.fallback_manager.clear_recovery_point.assert_called_once_with(
+            self.operation_id
+        )
+
+    def test_slow_operation_captures_state(self):
+        """Test that a long-running operation gets a recovery point."""
+        self.fallback_manager.has_recovery_point.return_value = False
+        self.mock_func.side_effect = lambda **kwargs: time.sleep(0.2) or "success"
+
+        result = with_recovery(
+            self.mock_func, self.operation_id, self.mock_state_getter,
+            fallback_manager=self.fallback_manager, capture_after=0.01,
+            arg1="value1"
+        )
+
+        self.assertEqual(result, "success")
+        self.mock_state_getter.assert_called_once_with(arg1="value1")
+        self.fallback_manager.save_recovery_point.assert_called_once_with(
+            self.operation_id, {"position": 42}
+        )
+
     def test_recovery_from_checkpoint(self):
         """Test with_recovery when recovering from a checkpoint."""
         # Setup manager behavior
@@ -421,8 +604,9 @@ class TestWithRecovery(unittest.TestCase):
         # Call with_recovery
         result = with_recovery(
             self.mock_func, self.operation_id,
-            self.mock_state_getter, self.fallback_manager,
-            arg1="value1"
+            self.mock_state_getter,
+            fallback_manager=self.fallback_manager,
+            capture_after=0, arg1="value1"
         )
 
         # Check function calls - should include recovery data in kwargs
@@ -448,7 +632,8 @@ class TestWithRecovery(unittest.TestCase):
         with self.assertRaises(ValueError) as context:
             with_recovery(
                 self.mock_func, self.operation_id,
-                self.mock_state_getter, self.fallback_manager,
+                self.mock_state_getter,
+                fallback_manager=self.fallback_manager,
                 arg1="value1"
             )
 
@@ -513,14 +698,13 @@ class TestRetryContext(unittest.TestCase):
     def test_retry_strategy(self):
         """Test RetryContext with a retryable error."""
         # Create retry context with a mock FallbackManager
-        with patch('error_handling.fallback.FallbackManager') as MockManager:
+        with patch('error_handling.fallback.FallbackManager') as MockManager, \
+             patch('error_handling.fallback.get_fallback_manager'):
             # Set up mock behavior
             mock_instance = MockManager.return_value
-            mock_instance.increment_retry_count.return_value = 1
+            mock_instance.record_failure.return_value = (1, FallbackStrategy.RETRY, 0.01)
             mock_instance.get_retry_count.return_value = 1
-            mock_instance.get_fallback_strategy.return_value = FallbackStrategy.RETRY
             mock_instance.can_retry.return_value = True
-            mock_instance.calculate_delay.return_value = 0.01
 
             # Create context
             context = RetryContext(self.operation_id, max_retries=3, base_delay=0.01)
@@ -540,19 +724,38 @@ class TestRetryContext(unittest.TestCase):
             self.assertEqual(context.strategy, FallbackStrategy.RETRY)
 
             # Check mock calls
-            mock_instance.increment_retry_count.assert_called_once_with(self.operation_id)
-            mock_instance.get_fallback_strategy.assert_called_once()
-            mock_instance.calculate_delay.assert_called_once()
+            mock_instance.record_failure.assert_called_once()
+            self.assertEqual(mock_instance.record_failure.call_args[0][0], self.operation_id)
+
+    def test_retry_delay_deferred_to_next_attempt(self):
+        """Test that the retry delay is waited out when the next attempt starts."""
+        with patch('error_handling.fallback.FallbackManager') as MockManager, \
+             patch('error_handling.fallback.get_fallback_manager'):
+            mock_instance = MockManager.return_value
+            mock_instance.record_failure.return_value = (1, FallbackStrategy.RETRY, 0.05)
+            mock_instance.can_retry.return_value = True
+
+            context = RetryContext(self.operation_id, max_retries=3, base_delay=0.01)
+
+            start = time.monotonic()
+            with context:
+                raise ValueError("Test error")
+            # The failing block returns without sleeping
+            self.assertLess(time.monotonic() - start, 0.05)
+
+            with context:
+                pass
+            self.assertGreaterEqual(time.monotonic() - start, 0.05)
 
     def test_non_retry_strategy(self):
         """Test RetryContext with a non-retryable error."""
         # Create retry context with a mock FallbackManager
-        with patch('error_handling.fallback.FallbackManager') as MockManager:
+        with patch('error_handling.fallback.FallbackManager') as MockManager, \
+             patch('error_handling.fallback.get_fallback_manager'):
             # Set up mock behavior
             mock_instance = MockManager.return_value
-            mock_instance.increment_retry_count.return_value = 1
+            mock_instance.record_failure.return_value = (1, FallbackStrategy.ABORT, 0.01)
             mock_instance.get_retry_count.return_value = 1
-            mock_instance.get_fallback_strategy.return_value = FallbackStrategy.ABORT
             # Even if can_retry is True, the strategy is ABORT
             mock_instance.can_retry.return_value = True
 
@@ -571,10 +774,28 @@ class TestRetryContext(unittest.TestCase):
             # should_retry should return False for ABORT strategy
             self.assertFalse(context.should_retry())
 
+    def test_retry_budget_exhausted(self):
+        """Test that RetryContext stops retrying once the shared budget is spent."""
+        budget = MagicMock(spec=FallbackManager)
+        budget.try_acquire_retry_token.return_value = False
+        with patch('error_handling.fallback.get_fallback_manager', return_value=budget):
+            context = RetryContext(self.operation_id, max_retries=3, base_delay=0.01)
+
+        with self.assertRaises(OperationError):
+            with context:
+                raise APIError("Test error")
+
+        budget.try_acquire_retry_token.assert_called_once_with()
+
+        with context:
+            pass
+        budget.refund_retry_token.assert_called_once_with()
+
     def test_reset(self):
         """Test RetryContext reset method."""
         # Create retry context with a mock FallbackManager
-        with patch('error_handling.fallback.FallbackManager') as MockManager:
+        with patch('error_handling.fallback.FallbackManager') as MockManager, \
+             patch('error_handling.fallback.get_fallback_manager'):
             # Set up mock instance
             mock_instance = MockManager.return_value
 
@@ -631,13 +852,13 @@ class TestOperationCheckpoint(unittest.TestCase):
 
         # Create checkpoint with mock fallback manager
         self.mock_manager = MagicMock(spec=FallbackManager)
-        with patch('error_handling.fallback.FallbackManager', return_value=self.mock_manager):
-            self.checkpoint = OperationCheckpoint(
-                self.operation_id,
-                checkpoint_interval=5,
-                save_func=self.mock_save_func,
-                load_func=self.mock_load_func
-            )
+        self.checkpoint = OperationCheckpoint(
+            self.operation_id,
+            checkpoint_interval=5,
+            save_func=self.mock_save_func,
+            load_func=self.mock_load_func,
+            fallback_manager=self.mock_manager
+        )
 
     def tearDown(self):
         """Tear down test fixtures."""
@@ -665,6 +886,25 @@ class TestOperationCheckpoint(unittest.TestCase):
         # Check final item count
         self.assertEqual(self.checkpoint.item_count, 10)
 
+    def test_background_save(self):
+        """Test that background saves reach save_func after flush."""
+        checkpoint = OperationCheckpoint(
+            self.operation_id,
+            checkpoint_interval=2,
+            save_func=self.mock_save_func,
+            fallback_manager=self.mock_manager,
+            background_save=True
+        )
+
+        for i in range(1, 5):
+            checkpoint.checkpoint({"position": i})
+        checkpoint.close()
+
+        # The latest state is always written
+        self.mock_save_func.assert_called_with({"position": 4})
+        self.mock_manager.save_recovery_point.assert_called_with(
+            self.operation_id, {"position": 4})
+
     def test_load_last_checkpoint(self):
         """Test loading the last checkpoint."""
         # Set up mock behavior
@@ -789,9 +1029,9 @@ class TestFallbackHelpers(unittest.TestCase):
         # Mock cleanup function
         mock_cleanup = MagicMock()
 
-        # Mock FallbackManager
-        with patch('error_handling.fallback.FallbackManager') as MockManager:
-            mock_instance = MockManager.return_value
+        # Mock the shared FallbackManager
+        with patch('error_handling.fallback.get_fallback_manager') as mock_get_manager:
+            mock_instance = mock_get_manager.return_value
 
             # Test data
             operation_id = "test_emergency"
@@ -814,6 +1054,9 @@ class TestFallbackHelpers(unittest.TestCase):
         manager = get_fallback_manager()
         self.assertIsInstance(manager, FallbackManager)
 
+        # Subsequent calls return the same shared instance
+        self.assertIs(get_fallback_manager(), manager)
+
     def test_retry_with_fallback_strategies(self):
         """Test the retry_with_fallback_strategies function."""
         # Mock function and fallback manager
@@ -822,7 +1065,7 @@ class TestFallbackHelpers(unittest.TestCase):
         # Patch relevant functions
         with patch('error_handling.fallback.retry_operation') as mock_retry, \
              patch('error_handling.fallback.switch_account_fallback') as mock_switch, \
-             patch('error_handling.fallback.FallbackManager') as MockManager:
+             patch('error_handling.fallback.get_fallback_manager') as mock_get_manager:
 
             # Set up return values
             mock_retry.return_value = "retry_success"
@@ -840,7 +1083,8 @@ class TestFallbackHelpers(unittest.TestCase):
             # First strategy should be used (RETRY)
             self.assertEqual(result, "retry_success")
             mock_retry.assert_called_once_with(
-                mock_func, "test_op", MockManager.return_value,
+                mock_func, "test_op",
+                fallback_manager=mock_get_manager.return_value,
                 arg1="value1", account_provider="provider"
             )
 
@@ -865,5 +1109,75 @@ class TestFallbackHelpers(unittest.TestCase):
             mock_switch.assert_called_once()
 
 
+
+class TestAsyncRetry(unittest.TestCase):
+    """Test suite for retry_operation_async and AsyncRetryContext."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the test class."""
+        print("\n===================================================================")
+        print("  TESTING: error_handling/fallback.py - Async retry")
+        print("===================================================================")
+        cls.start_time = time.time()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down after all tests in the class have run."""
+        elapsed = time.time() - cls.start_time
+        print("\n-------------------------------------------------------------------")
+        print(f"  COMPLETED ALL TESTS FOR: Async retry")
+        print(f"  Total time: {elapsed:.2f} seconds")
+        print("===================================================================")
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.start_time = time.time()
+        self.test_name = self.id().split('.')[-1]
+        print(f"\n→ Running: {self.test_name}")
+
+        self.operation_id = "test_async_retry"
+        self.fallback_manager = MagicMock(spec=FallbackManager)
+        self.fallback_manager.max_retries = 3
+        self.fallback_manager.record_failure.return_value = (1, FallbackStrategy.RETRY, 0.01)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        elapsed = time.time() - self.start_time
+        print(f"  ✓ Passed: {self.test_name} ({elapsed:.4f} sec)")
+
+    def test_retry_operation_async(self):
+        """Test retry_operation_async retries a coroutine until it succeeds."""
+        calls = []
+
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("First call fails")
+            return "success"
+
+        result = asyncio.run(retry_operation_async(
+            flaky, self.operation_id, fallback_manager=self.fallback_manager))
+
+        self.assertEqual(result, "success")
+        self.assertEqual(len(calls), 2)
+        self.fallback_manager.record_failure.assert_called_once()
+
+    def test_async_retry_context(self):
+        """Test AsyncRetryContext suppresses retryable errors."""
+        with patch('error_handling.fallback.FallbackManager', return_value=self.fallback_manager):
+            context = AsyncRetryContext(self.operation_id, max_retries=3, base_delay=0.01)
+
+        async def run():
+            async with context:
+                raise ValueError("Test error")
+
+        asyncio.run(run())
+
+        self.assertTrue(context.has_error)
+        self.assertEqual(context.current_attempt, 1)
+        self.assertEqual(context.strategy, FallbackStrategy.RETRY)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
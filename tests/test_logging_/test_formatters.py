@@ -192,7 +192,9 @@ class TestJSONFormatter(unittest.TestCase):
         self.assertIn('exception', log_data)
         self.assertEqual(log_data['exception']['type'], 'ValueError')
         self.assertEqual(log_data['exception']['message'], 'Test exception')
-        self.assertIsInstance(log_data['exception']['traceback'], list)
+        self.assertIsInstance(log_data['exception']['traceback'], str)
+        self.assertIn('Traceback (most recent call last)', log_data['exception']['traceback'])
+        self.assertIn('ValueError: Test exception', log_data['exception']['traceback'])
 
     def test_custom_data(self):
         """Test that custom data is included in the JSON output."""
@@ -225,6 +227,24 @@ class TestJSONFormatter(unittest.TestCase):
         self.assertEqual(log_data['data']['action'], 'login')
 
 
+    def test_non_finite_data(self):
+        """Test that NaN and Infinity are written as json writes them."""
+        record = logging.LogRecord(
+            name="test_logger", level=logging.INFO, pathname="test_file.py",
+            lineno=42, msg="Non-finite", args=(), exc_info=None
+        )
+        record.data = {"ratio": float('nan'), "limits": [float('-inf'), None]}
+
+        for orjson_available in (True, False):
+            with patch('logging_.formatters.ORJSON_AVAILABLE', orjson_available):
+                for indent in (None, 2, 4):
+                    output = JSONFormatter(indent=indent).format(record)
+                    log_data = json.loads(output)
+                    self.assertNotEqual(log_data['data']['ratio'],
+                                        log_data['data']['ratio'])  # NaN
+                    self.assertEqual(log_data['data']['limits'], [float('-inf'), None])
+
+
 class TestDetailedFormatter(unittest.TestCase):
     """Test the DetailedFormatter class."""
 
@@ -11,7 +11,9 @@ import logging
 import unittest
 import tempfile
 import time
+import json
 import threading
+import http.client
 import gzip
 import socket
 import io
@@ -232,20 +234,74 @@ class TestMultiProcessSafeTimedRotatingFileHandler(unittest.TestCase):
 
     def test_multiprocess_safety(self):
         """Test that the handler is safe to use from multiple processes."""
-        # This test uses the multiprocessing lock but doesn't actually spawn processes
-        # because that would make the test complex and potentially unreliable
+        # This test doesn't actually spawn processes because that would make
+        # the test complex and potentially unreliable; a second handler on the
+        # same file stands in for another process
 
-        # Mock the lock to verify it's used correctly
-        original_lock = self.handler._lock
-        mock_lock = MagicMock(wraps=original_lock)
-        self.handler._lock = mock_lock
+        other = MultiProcessSafeTimedRotatingFileHandler(
+            self.log_path,
+            when='s',
+            interval=1,
+            backupCount=3
+        )
+        other.setFormatter(logging.Formatter('%(message)s'))
+        try:
+            self.logger.info("Before rotation")
 
-        # Log a message
-        self.logger.info("Testing multiprocess safety")
+            # The first process rotates; the second one only reopens the new log
+            self.handler.doRollover()
+            other.doRollover()
 
-        # Verify the lock was acquired
-        mock_lock.__enter__.assert_called()
-        mock_lock.__exit__.assert_called()
+            self.logger.info("From first")
+            other.handle(logging.LogRecord(
+                "other", logging.INFO, "", 0, "From second", [], None
+            ))
+        finally:
+            other.close()
+
+        with open(self.log_path, 'r') as f:
+            content = f.read().splitlines()
+        self.assertEqual(content, ["From first", "From second"])
+
+        backups = [
+            name for name in os.listdir(self.temp_dir.name)
+            if name.startswith("test_timed.log.")
+        ]
+        self.assertEqual(len(backups), 1, "The log was rotated more than once")
+
+    def test_delayed_handler_keeps_other_rotation(self):
+        """Test that a delay=True handler doesn't rotate an already rotated log."""
+        other = MultiProcessSafeTimedRotatingFileHandler(
+            self.log_path,
+            when='s',
+            interval=1,
+            backupCount=3,
+            delay=True
+        )
+        other.setFormatter(logging.Formatter('%(message)s'))
+        try:
+            # The first process writes the old period, rotates, and writes on
+            self.logger.info("Old period")
+            period_end = self.handler.rolloverAt
+            self.handler.doRollover()
+            self.logger.info("New period")
+
+            # The delayed handler, still in the old period, has never opened
+            # the log
+            other.rolloverAt = period_end
+            other.doRollover()
+        finally:
+            other.close()
+
+        backups = [
+            name for name in os.listdir(self.temp_dir.name)
+            if name.startswith("test_timed.log.")
+        ]
+        self.assertEqual(len(backups), 1, "The log was rotated more than once")
+        with open(os.path.join(self.temp_dir.name, backups[0]), 'r') as f:
+            self.assertEqual(f.read().strip(), "Old period")
+        with open(self.log_path, 'r') as f:
+            self.assertEqual(f.read().strip(), "New period")
 
     def test_timed_rotation(self):
         """Test log rotation based on time interval."""
@@ -548,6 +604,40 @@ class TestBufferingHandler(unittest.TestCase):
         self.assertIn("Time test 2", output)
         self.assertIn("Time test 3", output)
 
+    def test_collapse_duplicates(self):
+        """Test that repeated messages in one flush are passed on once."""
+        self.handler.collapse_duplicates = True
+        for value in (1, None, 1, 1, 2):
+            if value is None:
+                self.logger.warning("Other")
+            else:
+                self.logger.info("Repeated %d", value)
+
+        lines = self.target_stream.getvalue().splitlines()
+        self.assertEqual(lines, ["Repeated 1 [x3]", "Other", "Repeated 2"])
+
+    def test_collapse_keeps_loggers_apart(self):
+        """Test that the same message from different loggers is not merged."""
+        self.handler.collapse_duplicates = True
+        names = ("test_buffering", "test_buffering.other") * 2
+        for name in names:
+            logging.getLogger(name).info("Same message")
+        self.logger.info("Last")
+
+        lines = self.target_stream.getvalue().splitlines()
+        self.assertEqual(lines, ["Same message [x2]", "Same message [x2]",
+                                 "Last"])
+
+    def test_collapse_off_by_default(self):
+        """Test that records are passed on unchanged by default."""
+        for _ in range(3):
+            self.logger.info("Repeated")
+        self.logger.info("Other")
+        self.logger.info("Last")
+
+        lines = self.target_stream.getvalue().splitlines()
+        self.assertEqual(lines, ["Repeated"] * 3 + ["Other", "Last"])
+
 
 class TestHTTPHandler(unittest.TestCase):
     """Test suite for the HTTPHandler class."""
@@ -689,6 +779,93 @@ class TestHTTPHandler(unittest.TestCase):
         self.assertIn('custom_field', mapped, "Custom field not added to mapping")
         self.assertEqual(mapped['custom_field'], 'custom_value', "Custom field has wrong value")
 
+    def test_batched_post_timer(self):
+        """Test that a partial batch is sent after flush_interval."""
+        handler = HTTPHandler(
+            host="localhost:8000",
+            url="/log",
+            method="POST",
+            batch_size=10,
+            flush_interval=0.05
+        )
+        self.mock_conn.reset_mock()
+        try:
+            handler.handle(logging.LogRecord(
+                "test_logger", logging.INFO, "", 0, "Lone record", [], None
+            ))
+            self.assertEqual(self.mock_conn.request.call_count, 0)
+
+            deadline = time.time() + 2
+            while not self.mock_conn.request.called and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(self.mock_conn.request.call_count, 1)
+        finally:
+            handler.close()
+
+    def test_batched_post(self):
+        """Test that records are sent as one NDJSON request per batch."""
+        handler = HTTPHandler(
+            host="localhost:8000",
+            url="/log",
+            method="POST",
+            batch_size=2
+        )
+        self.mock_conn.reset_mock()
+
+        for i in range(3):
+            handler.handle(logging.LogRecord(
+                "test_logger", logging.INFO, "", 0, f"Batched {i}", [], None
+            ))
+
+        # The first two records go out together, the third waits
+        self.assertEqual(self.mock_conn.request.call_count, 1)
+        body = self.mock_conn.request.call_args.kwargs['body']
+        messages = [json.loads(line)['message'] for line in body.splitlines()]
+        self.assertEqual(messages, ["Batched 0", "Batched 1"])
+
+        # Closing sends the rest
+        handler.close()
+        self.assertEqual(self.mock_conn.request.call_count, 2)
+        body = self.mock_conn.request.call_args.kwargs['body']
+        self.assertEqual(json.loads(body)['message'], "Batched 2")
+
+
+    def test_batched_post_retry(self):
+        """Test that only a request that failed to send is retried."""
+        handler = HTTPHandler(
+            host="localhost:8000",
+            url="/log",
+            method="POST",
+            batch_size=2
+        )
+        handler.handleError = MagicMock()
+        self.mock_conn.reset_mock()
+
+        def send_batch(tag):
+            for i in range(2):
+                handler.handle(logging.LogRecord(
+                    "test_logger", logging.INFO, "", 0, f"{tag} {i}", [], None
+                ))
+
+        try:
+            # Sending on the kept-alive connection fails: resent on a new one
+            self.mock_conn.request.side_effect = [None, ConnectionResetError(), None]
+            send_batch("First")
+            send_batch("Second")
+            self.assertEqual(self.mock_conn.request.call_count, 3)
+            self.assertEqual(self.mock_conn.getresponse.call_count, 2)
+            handler.handleError.assert_not_called()
+
+            # The response fails after the body was sent: not resent
+            self.mock_conn.request.side_effect = None
+            self.mock_conn.getresponse.side_effect = http.client.RemoteDisconnected()
+            send_batch("Third")
+            self.assertEqual(self.mock_conn.request.call_count, 4)
+            handler.handleError.assert_called_once()
+        finally:
+            self.mock_conn.getresponse.side_effect = None
+            handler.close()
+
 
 class TestSocketHandler(unittest.TestCase):
     """Test suite for the SocketHandler class."""
@@ -788,6 +965,59 @@ class TestSocketHandler(unittest.TestCase):
         # Check that sendall was called
         self.assertTrue(self.mock_socket.sendall.called)
 
+    def test_batched_sends(self):
+        """Test that records logged in a burst share one sendall."""
+        self.mock_socket.sendall = MagicMock()
+        self.handler.batch_size = 3
+        self.handler.flush_interval = 60
+
+        # The first record goes out at once, the next ones are coalesced
+        for i in range(4):
+            self.logger.info("Burst message %d", i)
+        self.assertEqual(self.mock_socket.sendall.call_count, 2)
+
+        # Flushing sends the rest
+        self.logger.info("Burst message 4")
+        self.handler.flush()
+        self.assertEqual(self.mock_socket.sendall.call_count, 3)
+
+    def test_burst_tail_sent_by_timer(self):
+        """Test that a held record is sent after flush_interval."""
+        self.mock_socket.sendall = MagicMock()
+        self.handler.flush_interval = 0.05
+
+        self.logger.info("First")
+        self.logger.info("Tail")
+        self.assertEqual(self.mock_socket.sendall.call_count, 1)
+
+        deadline = time.time() + 2
+        while self.mock_socket.sendall.call_count < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.mock_socket.sendall.call_count, 2)
+
+    def test_one_flush_thread_per_handler(self):
+        """Test that repeated bursts reuse a single flush thread."""
+        self.mock_socket.sendall = MagicMock()
+        self.handler.flush_interval = 0.01
+
+        def flush_threads():
+            return [t for t in threading.enumerate() if t.name == "log-flush"]
+
+        before = len(flush_threads())
+        for burst in range(5):
+            self.logger.info("First %d", burst)
+            self.logger.info("Tail %d", burst)
+            deadline = time.time() + 2
+            while self.handler._pending and time.time() < deadline:
+                time.sleep(0.005)
+            # The held tail of every burst is sent by the flush thread
+            self.assertEqual(self.handler._pending, [])
+        self.assertEqual(len(flush_threads()), before + 1)
+
+        self.handler.close()
+        self.handler._flush_thread.join(1)
+        self.assertFalse(self.handler._flush_thread.is_alive())
+
 
 class TestSysLogHandler(unittest.TestCase):
     """Test suite for the SysLogHandler class."""